@@ -13,6 +13,7 @@ Measures wall-clock time and prints results in all three formatter styles.
 from __future__ import annotations
 
 import asyncio
+import os
 import sys
 import time
 from pathlib import Path
@@ -24,6 +25,11 @@ sys.path.insert(0, str(_PROJECT_ROOT / "src"))
 from qualink.config import build_suite_from_yaml  # noqa: E402
 from qualink.formatters import HumanFormatter, JsonFormatter, MarkdownFormatter  # noqa: E402
 
+try:
+    import uvloop  # optional: faster event loop when installed
+except ImportError:
+    uvloop = None
+
 BENCHMARK_DIR = Path(__file__).resolve().parent
 YAML_PATH = BENCHMARK_DIR / "nyc_taxi_validation.yaml"
 DATA_DIR = BENCHMARK_DIR / "data"
@@ -37,29 +43,29 @@ FORMATTERS = {
 SEPARATOR = "=" * 72
 
 
-def _check_data() -> int:
-    """Verify parquet files exist and return the count."""
+def _scan_data() -> list[tuple[str, int]]:
+    """Return ``(name, size_bytes)`` for each parquet file, sorted by name, in one directory pass."""
     if not DATA_DIR.exists():
-        return 0
-    return len(list(DATA_DIR.glob("*.parquet")))
+        return []
+    with os.scandir(DATA_DIR) as it:
+        return sorted((e.name, e.stat().st_size) for e in it if e.name.endswith(".parquet"))
 
 
-def _print_header(file_count: int) -> None:
-    total_bytes = sum(f.stat().st_size for f in DATA_DIR.glob("*.parquet"))
+def _print_header(files: list[tuple[str, int]]) -> None:
+    total_bytes = sum(size for _, size in files)
     total_mb = total_bytes / (1024 * 1024)
-    files = sorted(DATA_DIR.glob("*.parquet"))
 
     print(SEPARATOR)
     print("  qualink Benchmark — NYC Taxi Trips")
     print(SEPARATOR)
-    print(f"  Parquet files : {file_count}")
+    print(f"  Parquet files : {len(files)}")
     print(f"  Total size    : {total_mb:,.1f} MB")
     print(f"  Data dir      : {DATA_DIR}")
     print(f"  YAML config   : {YAML_PATH}")
     print()
-    for f in files:
-        size_mb = f.stat().st_size / (1024 * 1024)
-        print(f"    • {f.name}  ({size_mb:,.1f} MB)")
+    for name, size in files:
+        size_mb = size / (1024 * 1024)
+        print(f"    • {name}  ({size_mb:,.1f} MB)")
     print(SEPARATOR)
     print()
 
@@ -67,7 +73,8 @@ def _print_header(file_count: int) -> None:
 async def _run_benchmark(fmt_name: str = "human") -> None:
     """Execute the YAML validation suite and print results."""
 
-    file_count = _check_data()
+    files = _scan_data()
+    file_count = len(files)
     if file_count == 0:
         print("❌  No parquet files found in benchmarks/data/")
         print()
@@ -79,7 +86,7 @@ async def _run_benchmark(fmt_name: str = "human") -> None:
         print()
         sys.exit(1)
 
-    _print_header(file_count)
+    _print_header(files)
 
     print(f"⏱  Running benchmark with {fmt_name!r} formatter …")
     print()
@@ -87,29 +94,24 @@ async def _run_benchmark(fmt_name: str = "human") -> None:
     t_start = time.perf_counter()
     builder = build_suite_from_yaml(str(YAML_PATH))
 
-    # Query total records from the registered table
-    total_records = 0
-    if builder._ctx is not None:
-        try:
-            count_sql = f"SELECT COUNT(*) AS cnt FROM {builder._table_name}"
-            rows = builder._ctx.sql(count_sql).collect()
-            total_records = int(rows[0].column("cnt")[0].as_py())
-        except Exception:
-            pass
-
     result = await builder.run()
     t_end = time.perf_counter()
 
     elapsed = t_end - t_start
+    # Populated by the suite's has_size check, so no separate COUNT(*) scan is needed.
+    total_rows = result.report.metrics.total_rows
+    total_records = "n/a" if total_rows is None else f"{total_rows / 1_000_000:,.2f}M"
 
-    formatter_cls = FORMATTERS.get(fmt_name, HumanFormatter)
-    output = formatter_cls().format(result)
-    print(output)
+    formatter = FORMATTERS.get(fmt_name, HumanFormatter)()
+    if isinstance(formatter, JsonFormatter):
+        formatter.stream(result, sys.stdout)
+    else:
+        print(formatter.format(result))
 
     print()
     print(SEPARATOR)
     print(f"  Status         : {'✅ PASSED' if result.success else '❌ FAILED'}")
-    print(f"  Total records  : {total_records / 1_000_000:,.2f}M")
+    print(f"  Total records  : {total_records}")
     print(f"  Wall-clock     : {elapsed:,.3f}s")
     print(f"  Checks         : {result.report.metrics.total_checks}")
     print(f"  Constraints    : {result.report.metrics.total_constraints}")
@@ -141,7 +143,10 @@ examples:
     )
     args = parser.parse_args()
 
-    asyncio.run(_run_benchmark(args.format))
+    if uvloop is not None:
+        uvloop.run(_run_benchmark(args.format))
+    else:
+        asyncio.run(_run_benchmark(args.format))
 
 
 if __name__ == "__main__":
@@ -17,6 +17,7 @@ from __future__ import annotations
 import ast
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +25,7 @@ from typing import Any
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent  # qualink/
 SRC_ROOT = REPO_ROOT / "src" / "qualink"
 OUT_FILE = REPO_ROOT / "docs" / "src" / "_data" / "api.json"
+CACHE_FILE = OUT_FILE.with_name("api.cache.json")
 
 # Module group → directory name mapping
 GROUPS: dict[str, str] = {
@@ -44,13 +46,26 @@ KEEP_DUNDERS = {"__init__", "__str__", "__repr__", "__post_init__"}
 
 # --- AST helpers -------------------------------------------------------------
 
+# ``ast.unparse`` results for the file being extracted, keyed by ``id(node)``.
+# Cleared per file: ids are only unique while that file's tree is alive.
+_UNPARSE_CACHE: dict[int, str] = {}
+
+
+def _source(node: ast.AST) -> str:
+    """Memoized ``ast.unparse`` — bases, annotations and decorators are unparsed more than once."""
+    key = id(node)
+    result = _UNPARSE_CACHE.get(key)
+    if result is None:
+        result = _UNPARSE_CACHE[key] = ast.unparse(node)
+    return result
+
 
 def _unparse(node: ast.expr | None) -> str:
     """Convert an AST node to its source-code string."""
     if node is None:
         return ""
     try:
-        result = ast.unparse(node)
+        result = _source(node)
         # Clean up common repr patterns for readability
         if result == "''":
             result = '""'
@@ -73,10 +88,7 @@ def _is_private(name: str) -> bool:
 
 def _get_decorators(node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef) -> list[str]:
     """Return decorator strings (e.g. ['dataclass(frozen=True)', 'staticmethod'])."""
-    result = []
-    for dec in node.decorator_list:
-        result.append(ast.unparse(dec))
-    return result
+    return [_source(dec) for dec in node.decorator_list]
 
 
 def _extract_arg(arg: ast.arg) -> dict[str, str]:
@@ -183,47 +195,53 @@ def _extract_function(node: ast.FunctionDef | ast.AsyncFunctionDef) -> dict[str,
     }
 
 
-def _extract_enum_members(node: ast.ClassDef) -> list[dict[str, str]]:
-    """Extract enum member assignments from a class body."""
-    members = []
-    for stmt in node.body:
-        if isinstance(stmt, ast.Assign):
-            for target in stmt.targets:
-                if isinstance(target, ast.Name) and not target.id.startswith("_"):
-                    members.append(
-                        {
-                            "name": target.id,
-                            "value": _unparse(stmt.value),
-                        }
-                    )
-        elif isinstance(stmt, ast.AnnAssign) and stmt.target and isinstance(stmt.target, ast.Name):
-            name = stmt.target.id
-            if not name.startswith("_"):
-                members.append(
-                    {
-                        "name": name,
-                        "value": _unparse(stmt.value) if stmt.value else "",
-                    }
-                )
-    return members
-
-
-def _extract_dataclass_fields(node: ast.ClassDef) -> list[dict[str, str]]:
-    """Extract field definitions from a dataclass body."""
-    fields = []
-    for stmt in node.body:
-        if isinstance(stmt, ast.AnnAssign) and stmt.target and isinstance(stmt.target, ast.Name):
-            name = stmt.target.id
-            field_info: dict[str, str] = {
-                "name": name,
-                "type": _unparse(stmt.annotation),
-            }
-            if stmt.value is not None:
-                val_str = _unparse(stmt.value)
-                # Detect field(default_factory=...) patterns
-                field_info["default"] = val_str
-            fields.append(field_info)
-    return fields
+class _ClassBodyVisitor(ast.NodeVisitor):
+    """Collect enum members, dataclass fields, methods and properties in one pass over a class body."""
+
+    def __init__(self, *, is_enum: bool, is_dataclass: bool) -> None:
+        self.is_enum = is_enum
+        self.is_dataclass = is_dataclass
+        self.fields: list[dict[str, str]] = []
+        self.enum_members: list[dict[str, str]] = []
+        self.methods: list[dict[str, Any]] = []
+        self.properties: list[dict[str, Any]] = []
+        self.init_params: list[dict[str, str]] | None = None
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        if not self.is_enum:
+            return
+        for target in node.targets:
+            if isinstance(target, ast.Name) and not target.id.startswith("_"):
+                self.enum_members.append({"name": target.id, "value": _unparse(node.value)})
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        if not isinstance(node.target, ast.Name):
+            return
+        name = node.target.id
+        if self.is_dataclass:
+            field_info: dict[str, str] = {"name": name, "type": _unparse(node.annotation)}
+            if node.value is not None:
+                field_info["default"] = _unparse(node.value)
+            self.fields.append(field_info)
+        if self.is_enum and not name.startswith("_"):
+            self.enum_members.append({"name": name, "value": _unparse(node.value) if node.value else ""})
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        if _is_private(node.name) and node.name not in KEEP_DUNDERS:
+            return
+        info = _extract_function(node)
+        # Separate properties from methods
+        if any(d in ("property", "functools.cached_property") for d in info["decorators"]):
+            self.properties.append(info)
+            return
+        self.methods.append(info)
+        if node.name == "__init__" and info["params"] and self.init_params is None:
+            self.init_params = info["params"]
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Do not descend into nested scopes."""
 
 
 def _is_enum(node: ast.ClassDef) -> bool:
@@ -235,13 +253,9 @@ def _is_enum(node: ast.ClassDef) -> bool:
     return False
 
 
-def _is_dataclass(node: ast.ClassDef) -> bool:
+def _is_dataclass(decorators: list[str]) -> bool:
     """Check if the class has a @dataclass decorator."""
-    for dec in node.decorator_list:
-        dec_str = ast.unparse(dec)
-        if "dataclass" in dec_str:
-            return True
-    return False
+    return any("dataclass" in dec for dec in decorators)
 
 
 def _extract_class(node: ast.ClassDef) -> dict[str, Any]:
@@ -250,30 +264,11 @@ def _extract_class(node: ast.ClassDef) -> dict[str, Any]:
     decorators = _get_decorators(node)
 
     is_enum = _is_enum(node)
-    is_dc = _is_dataclass(node)
-
-    # Fields (dataclass) or enum members
-    fields: list[dict[str, str]] = []
-    enum_members: list[dict[str, str]] = []
-    if is_dc:
-        fields = _extract_dataclass_fields(node)
-    if is_enum:
-        enum_members = _extract_enum_members(node)
-
-    # Methods and properties
-    methods = []
-    properties = []
-    for item in node.body:
-        if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
-            if _is_private(item.name):
-                if item.name not in KEEP_DUNDERS:
-                    continue
-            info = _extract_function(item)
-            # Separate properties from methods
-            if any(d in ("property", "functools.cached_property") for d in info["decorators"]):
-                properties.append(info)
-            else:
-                methods.append(info)
+    is_dc = _is_dataclass(decorators)
+
+    body = _ClassBodyVisitor(is_enum=is_enum, is_dataclass=is_dc)
+    for stmt in node.body:
+        body.visit(stmt)
 
     # Build class header signature
     dec_prefix = " ".join(f"@{d}" for d in decorators) + " " if decorators else ""
@@ -281,12 +276,9 @@ def _extract_class(node: ast.ClassDef) -> dict[str, Any]:
     class_signature = f"{dec_prefix}class {node.name}{base_suffix}"
     class_name_only = f"{node.name}{base_suffix}"
 
-    # Build init signature
     init_signature = ""
-    for m in methods:
-        if m["name"] == "__init__" and m["params"]:
-            init_signature = f'{node.name}({", ".join(_format_param(p) for p in m["params"])})'
-            break
+    if body.init_params is not None:
+        init_signature = f'{node.name}({", ".join(_format_param(p) for p in body.init_params)})'
 
     return {
         "name": node.name,
@@ -295,25 +287,39 @@ def _extract_class(node: ast.ClassDef) -> dict[str, Any]:
         "docstring": _get_docstring(node),
         "is_enum": is_enum,
         "is_dataclass": is_dc,
-        "fields": fields,
-        "enum_members": enum_members,
-        "methods": methods,
-        "properties": properties,
+        "fields": body.fields,
+        "enum_members": body.enum_members,
+        "methods": body.methods,
+        "properties": body.properties,
         "class_signature": class_signature,
         "class_name_only": class_name_only,
         "init_signature": init_signature,
     }
 
 
-def _extract_module_functions(tree: ast.Module) -> list[dict[str, Any]]:
-    """Extract top-level functions from a module."""
-    funcs = []
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            if _is_private(node.name):
-                continue
-            funcs.append(_extract_function(node))
-    return funcs
+class _ModuleVisitor(ast.NodeVisitor):
+    """Collect public top-level classes and functions in one pass over a module."""
+
+    def __init__(self) -> None:
+        self.classes: list[dict[str, Any]] = []
+        self.functions: list[dict[str, Any]] = []
+
+    def visit_Module(self, node: ast.Module) -> None:
+        for stmt in node.body:
+            self.visit(stmt)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        if not _is_private(node.name):
+            self.classes.append(_extract_class(node))
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        if not _is_private(node.name):
+            self.functions.append(_extract_function(node))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Only top-level definitions are documented."""
 
 
 # --- Main extraction ---------------------------------------------------------
@@ -323,55 +329,114 @@ def extract_file(filepath: Path, module_path: str) -> dict[str, Any]:
     """Parse a single Python file and extract all public API metadata."""
     source = filepath.read_text(encoding="utf-8")
     tree = ast.parse(source, filename=str(filepath))
+    _UNPARSE_CACHE.clear()
 
-    classes = []
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, ast.ClassDef):
-            if _is_private(node.name):
-                continue
-            classes.append(_extract_class(node))
-
-    functions = _extract_module_functions(tree)
+    visitor = _ModuleVisitor()
+    visitor.visit(tree)
 
     return {
         "module": module_path,
         "filename": filepath.name,
         "docstring": _get_docstring(tree),
-        "classes": classes,
-        "functions": functions,
+        "classes": visitor.classes,
+        "functions": visitor.functions,
     }
 
 
-def extract_group(group_name: str, dir_name: str) -> dict[str, Any]:
-    """Extract all modules in a group directory."""
+def _group_files(dir_name: str) -> list[tuple[Path, str]]:
+    """Return ``(file, module_path)`` for every documented module in a group directory."""
     group_dir = SRC_ROOT / dir_name
     if not group_dir.is_dir():
-        return {"modules": []}
+        return []
+    return [
+        (py_file, f"qualink.{dir_name}.{py_file.stem}")
+        for py_file in sorted(group_dir.glob("*.py"))
+        if py_file.name not in SKIP_FILES
+    ]
 
-    modules = []
-    for py_file in sorted(group_dir.glob("*.py")):
-        if py_file.name in SKIP_FILES:
-            continue
-        module_path = f"qualink.{dir_name}.{py_file.stem}"
-        try:
-            mod = extract_file(py_file, module_path)
-            # Only include if it has public content
-            if mod["classes"] or mod["functions"]:
-                modules.append(mod)
-        except SyntaxError as e:
-            print(f"WARNING: Syntax error in {py_file}: {e}", file=sys.stderr)
 
+def _extract_job(job: tuple[Path, str]) -> dict[str, Any] | None:
+    """Extract one module, returning ``None`` if it has no public content or cannot be parsed."""
+    py_file, module_path = job
+    try:
+        mod = extract_file(py_file, module_path)
+    except SyntaxError as e:
+        print(f"WARNING: Syntax error in {py_file}: {e}", file=sys.stderr)
+        return None
+    # Only include if it has public content
+    if mod["classes"] or mod["functions"]:
+        return mod
+    return None
+
+
+def extract_group(group_name: str, dir_name: str) -> dict[str, Any]:
+    """Extract all modules in a group directory."""
+    modules = [mod for mod in map(_extract_job, _group_files(dir_name)) if mod is not None]
     return {"modules": modules}
 
 
+def _file_stamp(path: Path) -> list[int]:
+    """Return ``[mtime_ns, size]`` used to detect changed source files."""
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_cache() -> dict[str, Any]:
+    """Load per-file results from the previous run.
+
+    The cache is discarded when this script itself changes, since the extracted
+    shape may differ.
+    """
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if cache.get("extractor") != _file_stamp(Path(__file__)):
+        return {}
+    return cache.get("files", {})
+
+
+def _save_cache(files: dict[str, Any]) -> None:
+    payload = {"extractor": _file_stamp(Path(__file__)), "files": files}
+    CACHE_FILE.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+
 def main() -> None:
-    data: dict[str, Any] = {}
-    for group_name, dir_name in GROUPS.items():
-        data[group_name] = extract_group(group_name, dir_name)
+    jobs = {group_name: _group_files(dir_name) for group_name, dir_name in GROUPS.items()}
+    all_jobs = [job for group_jobs in jobs.values() for job in group_jobs]
+
+    # Reuse results for files whose mtime and size are unchanged since the last run.
+    cache = _load_cache()
+    cache_entries: dict[str, Any] = {}
+    results: dict[tuple[Path, str], dict[str, Any] | None] = {}
+    stale: list[tuple[Path, str]] = []
+    for job in all_jobs:
+        key = job[0].relative_to(REPO_ROOT).as_posix()
+        stamp = _file_stamp(job[0])
+        entry = cache.get(key)
+        if entry is not None and [entry["mtime"], entry["size"]] == stamp:
+            results[job] = entry["data"]
+        else:
+            stale.append(job)
+        cache_entries[key] = {"mtime": stamp[0], "size": stamp[1]}
+
+    # Parsing is CPU-bound and independent per file, so fan the stale files out over one pool.
+    if stale:
+        with ProcessPoolExecutor() as executor:
+            results.update(zip(stale, executor.map(_extract_job, stale, chunksize=4), strict=True))
+
+    for job in all_jobs:
+        cache_entries[job[0].relative_to(REPO_ROOT).as_posix()]["data"] = results[job]
+
+    data: dict[str, Any] = {
+        group_name: {"modules": [results[job] for job in group_jobs if results[job] is not None]}
+        for group_name, group_jobs in jobs.items()
+    }
 
     # Ensure output directory exists
     OUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     OUT_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    _save_cache(cache_entries)
 
     # Print summary
     total_classes = 0
@@ -1,36 +1,59 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from qualink.core.constraint import Constraint, ConstraintResult, ConstraintStatus
+from qualink.constraints.approx_count_distinct import ApproxCountDistinctConstraint
+from qualink.constraints.approx_quantile import ApproxQuantileConstraint
+from qualink.constraints.assertion import EQUAL_TO_ONE, Assertion
+from qualink.constraints.column_count import ColumnCountConstraint
+from qualink.constraints.column_exists import ColumnExistsConstraint
+from qualink.constraints.completeness import CompletenessConstraint
+from qualink.constraints.compliance import ComplianceConstraint
+from qualink.constraints.correlation import CorrelationConstraint
+from qualink.constraints.custom_sql import CustomSqlConstraint
+from qualink.constraints.distinctness import DistinctnessConstraint
+from qualink.constraints.format import FormatConstraint, FormatType
+from qualink.constraints.max_length import MaxLengthConstraint
+from qualink.constraints.min_length import MinLengthConstraint
+from qualink.constraints.pattern_match import PatternMatchConstraint
+from qualink.constraints.referential_integrity import ReferentialIntegrityConstraint
+from qualink.constraints.row_count_match import RowCountMatchConstraint
+from qualink.constraints.schema_match import SchemaMatchConstraint
+from qualink.constraints.size import SizeConstraint
+from qualink.constraints.statistics import StatisticalConstraint, StatisticType
+from qualink.constraints.unique_value_ratio import UniqueValueRatioConstraint
+from qualink.constraints.uniqueness import UniquenessConstraint
+from qualink.core.constraint import ConstraintStatus, FusableConstraint, query_row
 from qualink.core.level import Level
 from qualink.core.logging_mixin import LoggingMixin, get_logger
 from qualink.core.result import CheckStatus
-
-CheckLevel = Level
+from qualink.core.run_cache import cached_value, store_value
 
 if TYPE_CHECKING:
+    from collections.abc import Container
+
     from datafusion import SessionContext
 
-    from qualink.constraints import Assertion
+    from qualink.core.constraint import Constraint, ConstraintResult
 
 _logger = get_logger("checks.check")
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     check: Check
     status: str
     constraint_results: list[ConstraintResult] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Check:
     _name: str
-    _level: CheckLevel
+    _level: Level
     _description: str
-    _constraints: list[Constraint] = field(default_factory=list)
+    _constraints: tuple[Constraint, ...] = ()
 
     @staticmethod
     def builder(name: str) -> CheckBuilder:
@@ -59,22 +82,31 @@ class Check:
             len(self._constraints),
             table_name,
         )
-        results: list[ConstraintResult] = []
-        for constraint in self._constraints:
-            _logger.debug("Evaluating constraint: %s", constraint.name())
-            result = await constraint.evaluate(ctx, table_name)
+        precomputed = self._cached_results(table_name)
+        sql, fused = self._compile_fused_sql(table_name, skip=precomputed)
+        if fused:
+            precomputed.update(await self._evaluate_fused(ctx, table_name, sql, fused))
+        # Constraints are independent, so evaluate them concurrently; gather preserves input order.
+        results: list[ConstraintResult] = list(
+            await asyncio.gather(
+                *(self._evaluate(c, ctx, table_name, precomputed) for c in self._constraints)
+            )
+        )
+        passed = failed = 0
+        for constraint, result in zip(self._constraints, results, strict=True):
             if not result.constraint_name:
                 result.constraint_name = constraint.name()
-            results.append(result)
+            if result.status is ConstraintStatus.SUCCESS:
+                passed += 1
+            elif result.status is ConstraintStatus.FAILURE:
+                failed += 1
 
-        has_failure = any(r.status == ConstraintStatus.FAILURE for r in results)
+        has_failure = failed > 0
         if has_failure:
             status = CheckStatus.ERROR if self._level == Level.ERROR else CheckStatus.WARNING
         else:
             status = CheckStatus.SUCCESS
 
-        passed = sum(1 for r in results if r.status == ConstraintStatus.SUCCESS)
-        failed = sum(1 for r in results if r.status == ConstraintStatus.FAILURE)
         if has_failure:
             _logger.warning(
                 "Check '%s' completed with status=%s (passed=%d, failed=%d)",
@@ -94,10 +126,80 @@ class Check:
 
         return CheckResult(check=self, status=status, constraint_results=results)
 
+    def _cached_results(self, table_name: str) -> dict[int, ConstraintResult]:
+        """Results for fusable constraints whose value is already in the run cache."""
+        results: dict[int, ConstraintResult] = {}
+        for constraint in self._constraints:
+            if not isinstance(constraint, FusableConstraint):
+                continue
+            value = cached_value(table_name, constraint.sql_fragment())
+            if value is not None:
+                _logger.debug("Using cached value for constraint: %s", constraint.name())
+                results[id(constraint)] = constraint.evaluate_from_row(value)
+        return results
+
+    def _compile_fused_sql(
+        self, table_name: str, skip: Container[int] = ()
+    ) -> tuple[str, list[tuple[FusableConstraint, str]]]:
+        """Combine the aggregate of every fusable constraint into one ``SELECT``.
+
+        Constraints whose ``id`` is in *skip* are left out, and constraints with an
+        identical fragment share one projection.  Returns the query and the covered
+        constraints, each paired with the result column that holds its value.
+        """
+        fused: list[tuple[FusableConstraint, str]] = []
+        aliases: dict[str, str] = {}
+        for constraint in self._constraints:
+            if id(constraint) in skip or not isinstance(constraint, FusableConstraint):
+                continue
+            alias = aliases.setdefault(constraint.sql_fragment(), f"c{len(aliases)}")
+            fused.append((constraint, alias))
+        if not fused:
+            return "", fused
+        projections = ", ".join(f"{fragment} AS {alias}" for fragment, alias in aliases.items())
+        return f"SELECT {projections} FROM {table_name}", fused
+
+    async def _evaluate_fused(
+        self, ctx: SessionContext, table_name: str, sql: str, fused: list[tuple[FusableConstraint, str]]
+    ) -> dict[int, ConstraintResult]:
+        """Run the fused query, keyed by ``id(constraint)``; empty if it fails."""
+        _logger.debug("Executing fused SQL for check '%s': %s", self._name, sql)
+        try:
+            # The aggregate query yields one row; convert it to Python values in a single call.
+            row = await query_row(ctx, sql)
+        except Exception:
+            _logger.warning(
+                "Fused query for check '%s' failed; evaluating constraints individually",
+                self._name,
+                exc_info=True,
+            )
+            return {}
+        results: dict[int, ConstraintResult] = {}
+        for constraint, alias in fused:
+            value = row[alias]
+            store_value(table_name, constraint.sql_fragment(), value)
+            results[id(constraint)] = constraint.evaluate_from_row(value)
+        return results
+
+    @staticmethod
+    async def _evaluate(
+        constraint: Constraint,
+        ctx: SessionContext,
+        table_name: str,
+        precomputed: dict[int, ConstraintResult],
+    ) -> ConstraintResult:
+        result = precomputed.get(id(constraint))
+        if result is not None:
+            return result
+        _logger.debug("Evaluating constraint: %s", constraint.name())
+        return await constraint.evaluate(ctx, table_name)
+
 
 class CheckBuilder(LoggingMixin):
     """Fluent builder for :class:`Check`."""
 
+    __slots__ = ("_constraints", "_description", "_level", "_name")
+
     def __init__(self, name: str) -> None:
         self._name = name
         self._level = Level.ERROR
@@ -120,55 +222,36 @@ class CheckBuilder(LoggingMixin):
         return self
 
     def is_complete(self, column: str, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.assertion import Assertion
-        from qualink.constraints.completeness import CompletenessConstraint
-
-        self._constraints.append(CompletenessConstraint(column, Assertion.equal_to(1.0)))
+        self._constraints.append(CompletenessConstraint(column, EQUAL_TO_ONE))
         return self
 
     def has_completeness(self, column: str, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.completeness import CompletenessConstraint
-
         self._constraints.append(CompletenessConstraint(column, assertion))
         return self
 
     def has_column(self, column: str, *, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.column_exists import ColumnExistsConstraint
-
         self._constraints.append(ColumnExistsConstraint(column, hint=hint))
         return self
 
     def is_unique(self, *columns: str, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.assertion import Assertion
-        from qualink.constraints.uniqueness import UniquenessConstraint
-
-        self._constraints.append(UniquenessConstraint(list(columns), Assertion.equal_to(1.0)))
+        self._constraints.append(UniquenessConstraint(columns, EQUAL_TO_ONE))
         return self
 
     def is_primary_key(self, *columns: str, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.assertion import Assertion
-        from qualink.constraints.uniqueness import UniquenessConstraint
-
-        self._constraints.append(UniquenessConstraint(list(columns), Assertion.equal_to(1.0)))
+        self._constraints.append(UniquenessConstraint(columns, EQUAL_TO_ONE))
         return self
 
     def has_uniqueness(self, columns: list[str], assertion: Assertion, *, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.uniqueness import UniquenessConstraint
-
         self._constraints.append(UniquenessConstraint(columns, assertion))
         return self
 
     def has_distinctness(self, columns: list[str], assertion: Assertion, *, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.distinctness import DistinctnessConstraint
-
         self._constraints.append(DistinctnessConstraint(columns, assertion, hint=hint))
         return self
 
     def has_unique_value_ratio(
         self, columns: list[str], assertion: Assertion, *, hint: str = ""
     ) -> CheckBuilder:
-        from qualink.constraints.unique_value_ratio import UniqueValueRatioConstraint
-
         self._constraints.append(UniqueValueRatioConstraint(columns, assertion, hint=hint))
         return self
 
@@ -176,13 +259,9 @@ class CheckBuilder(LoggingMixin):
         self, predicate: str, name_label: str = "", assertion: Assertion | None = None, *, hint: str = ""
     ) -> CheckBuilder:
         if assertion is not None:
-            from qualink.constraints.compliance import ComplianceConstraint
-
             label = name_label or predicate[:50]
             self._constraints.append(ComplianceConstraint(label, predicate, assertion, hint=hint))
         else:
-            from qualink.constraints.custom_sql import CustomSqlConstraint
-
             self._constraints.append(CustomSqlConstraint(predicate, hint=name_label or hint))
         return self
 
@@ -190,111 +269,76 @@ class CheckBuilder(LoggingMixin):
         self, column: str, pattern: str, assertion: Assertion | None = None, *, hint: str = ""
     ) -> CheckBuilder:
         if assertion is not None:
-            from qualink.constraints.pattern_match import PatternMatchConstraint
-
             self._constraints.append(PatternMatchConstraint(column, pattern, assertion, hint=hint))
         else:
-            from qualink.constraints.format import FormatConstraint, FormatType
-
             self._constraints.append(FormatConstraint(column, FormatType.REGEX, pattern=pattern))
         return self
 
     def contains_email(self, column: str, assertion: Assertion | None = None) -> CheckBuilder:
-        from qualink.constraints.format import FormatConstraint, FormatType
-
         self._constraints.append(FormatConstraint(column, FormatType.EMAIL))
         return self
 
     def contains_url(self, column: str, assertion: Assertion | None = None) -> CheckBuilder:
-        from qualink.constraints.format import FormatConstraint, FormatType
-
         self._constraints.append(FormatConstraint(column, FormatType.URL))
         return self
 
     def contains_credit_card(self, column: str) -> CheckBuilder:
-        from qualink.constraints.format import FormatConstraint, FormatType
-
         self._constraints.append(FormatConstraint(column, FormatType.CREDIT_CARD))
         return self
 
     def contains_ssn(self, column: str) -> CheckBuilder:
-        from qualink.constraints.format import FormatConstraint, FormatType
-
         self._constraints.append(FormatConstraint(column, FormatType.SSN))
         return self
 
     def has_min(self, column: str, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.statistics import StatisticalConstraint, StatisticType
-
         self._constraints.append(StatisticalConstraint(column, StatisticType.MIN, assertion))
         return self
 
     def has_max(self, column: str, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.statistics import StatisticalConstraint, StatisticType
-
         self._constraints.append(StatisticalConstraint(column, StatisticType.MAX, assertion))
         return self
 
     def has_mean(self, column: str, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.statistics import StatisticalConstraint, StatisticType
-
         self._constraints.append(StatisticalConstraint(column, StatisticType.MEAN, assertion))
         return self
 
     def has_sum(self, column: str, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.statistics import StatisticalConstraint, StatisticType
-
         self._constraints.append(StatisticalConstraint(column, StatisticType.SUM, assertion))
         return self
 
     def has_standard_deviation(self, column: str, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.statistics import StatisticalConstraint, StatisticType
-
         self._constraints.append(StatisticalConstraint(column, StatisticType.STDDEV, assertion))
         return self
 
     def has_min_length(self, column: str, assertion: Assertion, *, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.min_length import MinLengthConstraint
-
         self._constraints.append(MinLengthConstraint(column, assertion, hint=hint))
         return self
 
     def has_max_length(self, column: str, assertion: Assertion, *, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.max_length import MaxLengthConstraint
-
         self._constraints.append(MaxLengthConstraint(column, assertion, hint=hint))
         return self
 
     def has_approx_count_distinct(self, column: str, assertion: Assertion, *, hint: str = "") -> CheckBuilder:
-        from qualink.constraints.approx_count_distinct import ApproxCountDistinctConstraint
-
         self._constraints.append(ApproxCountDistinctConstraint(column, assertion, hint=hint))
         return self
 
     def has_approx_quantile(
         self, column: str, quantile: float, assertion: Assertion, *, hint: str = ""
     ) -> CheckBuilder:
-        from qualink.constraints.approx_quantile import ApproxQuantileConstraint
-
         self._constraints.append(ApproxQuantileConstraint(column, quantile, assertion, hint=hint))
         return self
 
     def has_size(self, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.size import SizeConstraint
-
         self._constraints.append(SizeConstraint(assertion))
         return self
 
     def has_column_count(self, assertion: Assertion) -> CheckBuilder:
-        from qualink.constraints.column_count import ColumnCountConstraint
-
         self._constraints.append(ColumnCountConstraint(assertion))
         return self
 
     def custom_sql(
         self, expression: str, assertion: Assertion | None = None, *, hint: str = ""
     ) -> CheckBuilder:  # E501
-        from qualink.constraints.custom_sql import CustomSqlConstraint
 
         self._constraints.append(CustomSqlConstraint(expression, hint=hint))
         return self
@@ -302,8 +346,6 @@ class CheckBuilder(LoggingMixin):
     def has_correlation(
         self, column_a: str, column_b: str, assertion: Assertion, *, hint: str = ""
     ) -> CheckBuilder:
-        from qualink.constraints.correlation import CorrelationConstraint
-
         self._constraints.append(CorrelationConstraint(column_a, column_b, assertion, hint=hint))
         return self
 
@@ -317,8 +359,6 @@ class CheckBuilder(LoggingMixin):
         *,
         hint: str = "",
     ) -> CheckBuilder:
-        from qualink.constraints.referential_integrity import ReferentialIntegrityConstraint
-
         self._constraints.append(
             ReferentialIntegrityConstraint(
                 child_table,
@@ -334,16 +374,12 @@ class CheckBuilder(LoggingMixin):
     def row_count_match(
         self, table_a: str, table_b: str, assertion: Assertion, *, hint: str = ""
     ) -> CheckBuilder:
-        from qualink.constraints.row_count_match import RowCountMatchConstraint
-
         self._constraints.append(RowCountMatchConstraint(table_a, table_b, assertion, hint=hint))
         return self
 
     def schema_match(
         self, table_a: str, table_b: str, assertion: Assertion, *, hint: str = ""
     ) -> CheckBuilder:
-        from qualink.constraints.schema_match import SchemaMatchConstraint
-
         self._constraints.append(SchemaMatchConstraint(table_a, table_b, assertion, hint=hint))
         return self
 
@@ -358,5 +394,5 @@ class CheckBuilder(LoggingMixin):
             _name=self._name,
             _level=self._level,
             _description=self._description,
-            _constraints=self._constraints,
+            _constraints=tuple(self._constraints),
         )
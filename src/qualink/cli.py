@@ -26,7 +26,7 @@ from qualink.formatters import (
     MarkdownFormatter,
     ResultFormatter,
 )
-from qualink.output import OutputService, normalize_output_specs, write_text_output
+from qualink.output import OutputService, normalize_output_specs, write_chunks_output
 
 if TYPE_CHECKING:
     from qualink.output import OutputSpec
@@ -108,12 +108,15 @@ def main(
         colorize=not no_color,
     )
     formatter = _FORMATTERS[fmt](config=fmt_config)
-    formatted = formatter.format(result)
+    # Written chunk by chunk, so large reports are never held as one string.
+    chunks = formatter.iter_format(result)
 
     if output:
-        write_text_output(output, formatted)
+        write_chunks_output(output, chunks)
     else:
-        click.echo(formatted)
+        for chunk in chunks:
+            click.echo(chunk, nl=False)
+        click.echo()
         if configured_outputs:
             OutputService().emit_many(result, configured_outputs)
 
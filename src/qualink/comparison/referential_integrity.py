@@ -3,12 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from qualink.core.constraint import query_row
 from qualink.core.logging_mixin import LoggingMixin
 
 if TYPE_CHECKING:
     from datafusion import SessionContext
 
 
+def _quote(identifier: str) -> str:
+    """Double-quote a column name, doubling any embedded quotes."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
 @dataclass(frozen=True)
 class ReferentialIntegrityResult:
     match_ratio: float
@@ -23,7 +29,7 @@ class ReferentialIntegrityResult:
 class ReferentialIntegrity(LoggingMixin):
     """Checks that all values in *child_table.child_column* exist in *parent_table.parent_column*.
 
-    Executes a LEFT ANTI JOIN via DataFusion SQL.
+    Counts the non-null child values and those without a parent in one LEFT JOIN via DataFusion SQL.
     """
 
     def __init__(
@@ -37,19 +43,21 @@ class ReferentialIntegrity(LoggingMixin):
         self._child_col = child_column
         self._parent_table = parent_table
         self._parent_col = parent_column
+        child = _quote(child_column)
+        # Parent keys are deduplicated so repeated keys cannot multiply the child rows.
+        self._sql = (
+            f"SELECT COUNT(c.{child}) AS total, "
+            f"COUNT(c.{child}) FILTER (WHERE p.k IS NULL) AS unmatched "
+            f"FROM {child_table} c "
+            f"LEFT JOIN (SELECT DISTINCT {_quote(parent_column)} AS k FROM {parent_table}) p "
+            f"ON c.{child} = p.k"
+        )
 
     async def run(self, ctx: SessionContext) -> ReferentialIntegrityResult:
-        total_sql = f'SELECT COUNT(*) AS cnt FROM {self._child_table} WHERE "{self._child_col}" IS NOT NULL'
-        self.logger.debug("Executing SQL: %s", total_sql)
-        total = int(ctx.sql(total_sql).collect()[0].column("cnt")[0].as_py())
-
-        unmatched_sql = (
-            f"SELECT COUNT(*) AS cnt FROM {self._child_table} c "
-            f'LEFT JOIN {self._parent_table} p ON c."{self._child_col}" = p."{self._parent_col}" '
-            f'WHERE p."{self._parent_col}" IS NULL AND c."{self._child_col}" IS NOT NULL'
-        )
-        self.logger.debug("Executing SQL: %s", unmatched_sql)
-        unmatched = int(ctx.sql(unmatched_sql).collect()[0].column("cnt")[0].as_py())
+        self.logger.debug("Executing SQL: %s", self._sql)
+        row = await query_row(ctx, self._sql)
+        total = int(row["total"])
+        unmatched = int(row["unmatched"])
         ratio = (total - unmatched) / max(total, 1)
         self.logger.info(
             "ReferentialIntegrity result: ratio=%.4f, unmatched=%d, total=%d", ratio, unmatched, total
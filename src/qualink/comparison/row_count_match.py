@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from qualink.core.constraint import query_row
 from qualink.core.logging_mixin import LoggingMixin
 
 if TYPE_CHECKING:
@@ -28,14 +29,15 @@ class RowCountMatch(LoggingMixin):
     def __init__(self, table_a: str, table_b: str) -> None:
         self._table_a = table_a
         self._table_b = table_b
+        self._sql = (
+            f"SELECT (SELECT COUNT(*) FROM {table_a}) AS count_a, (SELECT COUNT(*) FROM {table_b}) AS count_b"
+        )
 
     async def run(self, ctx: SessionContext) -> RowCountMatchResult:
-        sql_a = f"SELECT COUNT(*) AS c FROM {self._table_a}"
-        sql_b = f"SELECT COUNT(*) AS c FROM {self._table_b}"
-        self.logger.debug("Executing SQL: %s", sql_a)
-        ca = int(ctx.sql(sql_a).collect()[0].column("c")[0].as_py())
-        self.logger.debug("Executing SQL: %s", sql_b)
-        cb = int(ctx.sql(sql_b).collect()[0].column("c")[0].as_py())
+        self.logger.debug("Executing SQL: %s", self._sql)
+        row = await query_row(ctx, self._sql)
+        ca = int(row["count_a"])
+        cb = int(row["count_b"])
         ratio = min(ca, cb) / max(max(ca, cb), 1)
         self.logger.info("RowCountMatch result: count_a=%d, count_b=%d, ratio=%.4f", ca, cb, ratio)
         return RowCountMatchResult(count_a=ca, count_b=cb, ratio=ratio)
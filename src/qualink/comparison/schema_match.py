@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from qualink.core.logging_mixin import LoggingMixin
+from qualink.core.run_cache import table_schema
 
 if TYPE_CHECKING:
     from datafusion import SessionContext
@@ -32,23 +33,29 @@ class SchemaMatch(LoggingMixin):
 
     async def run(self, ctx: SessionContext) -> SchemaMatchResult:
         self.logger.debug("Comparing schemas of '%s' and '%s'", self._table_a, self._table_b)
-        sa = ctx.sql(f"SELECT * FROM {self._table_a} LIMIT 0").schema()
-        sb = ctx.sql(f"SELECT * FROM {self._table_b} LIMIT 0").schema()
+        # Read from the table providers and shared across the run, so no probe query is planned.
+        sa = table_schema(ctx, self._table_a)
+        sb = table_schema(ctx, self._table_b)
 
-        cols_a = {sa.field(i).name: str(sa.field(i).type) for i in range(len(sa))}
-        cols_b = {sb.field(i).name: str(sb.field(i).type) for i in range(len(sb))}
+        cols_a = {f.name: str(f.type) for f in sa}
+        cols_b = {f.name: str(f.type) for f in sb}
 
-        matching, mismatches = [], {}
-        for name in set(cols_a) & set(cols_b):
-            if cols_a[name] == cols_b[name]:
+        matching: list[str] = []
+        only_in_a: list[str] = []
+        mismatches: dict[str, tuple[str, str]] = {}
+        for name, type_a in cols_a.items():
+            type_b = cols_b.get(name)
+            if type_b is None:
+                only_in_a.append(name)
+            elif type_a == type_b:
                 matching.append(name)
             else:
-                mismatches[name] = (cols_a[name], cols_b[name])
+                mismatches[name] = (type_a, type_b)
 
         result = SchemaMatchResult(
             matching_columns=sorted(matching),
-            only_in_a=sorted(set(cols_a) - set(cols_b)),
-            only_in_b=sorted(set(cols_b) - set(cols_a)),
+            only_in_a=sorted(only_in_a),
+            only_in_b=sorted(name for name in cols_b if name not in cols_a),
             type_mismatches=mismatches,
         )
         self.logger.info(
@@ -14,7 +14,7 @@ Or for more control::
     result = await builder.run()
 """
 
-from qualink.config.builder import build_suite_from_yaml, run_yaml
+from qualink.config.builder import build_suite_from_yaml, clear_compiled_checks, run_yaml
 from qualink.config.parser import load_yaml, parse_assertion
 from qualink.config.registry import available_types, build_constraint
 
@@ -22,6 +22,7 @@ __all__ = [
     "available_types",
     "build_constraint",
     "build_suite_from_yaml",
+    "clear_compiled_checks",
     "load_yaml",
     "parse_assertion",
     "run_yaml",
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import copy
 from typing import TYPE_CHECKING, Any
 
-from datafusion import SessionContext
-
 from qualink.checks.check import Check, CheckBuilder
 from qualink.config.parser import load_yaml
 from qualink.config.registry import build_constraint
+from qualink.constraints.assertion import EQUAL_TO_ONE, Assertion
 from qualink.core.level import Level
 from qualink.core.logging_mixin import get_logger
 from qualink.core.suite import ValidationSuite, ValidationSuiteBuilder
@@ -18,37 +18,48 @@ from qualink.datasources import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    from datafusion import SessionContext
+
     from qualink.core.result import ValidationResult
 
 _logger = get_logger("config.builder")
 
+# Common spellings are pre-populated so most lookups avoid ``str.lower()``.
 _LEVEL_MAP: dict[str, Level] = {
-    "error": Level.ERROR,
-    "warning": Level.WARNING,
-    "info": Level.INFO,
+    spelling: level
+    for level in Level
+    for spelling in (level.name.lower(), level.name, level.name.capitalize())
 }
 
-# Bound keys that are converted into assertion shorthands.
-_BOUND_KEYS = {"gt", "gte", "lt", "lte", "eq", "between", "min", "max", "value"}
-
-# Map inline bound keys to assertion shorthand strings.
-_BOUND_TO_OP: dict[str, str] = {
-    "gt": ">",
-    "gte": ">=",
-    "min": ">=",
-    "lt": "<",
-    "lte": "<=",
-    "max": "<=",
-    "eq": "==",
-    "value": "==",
+# Map inline bound keys straight to ``Assertion`` factories (no shorthand round-trip).
+_BOUND_FACTORIES: dict[str, Callable[[Any], Assertion]] = {
+    "gt": lambda v: Assertion.greater_than(float(v)),
+    "gte": lambda v: Assertion.greater_than_or_equal(float(v)),
+    "min": lambda v: Assertion.greater_than_or_equal(float(v)),
+    "lt": lambda v: Assertion.less_than(float(v)),
+    "lte": lambda v: Assertion.less_than_or_equal(float(v)),
+    "max": lambda v: Assertion.less_than_or_equal(float(v)),
+    "eq": lambda v: Assertion.equal_to(float(v)),
+    "value": lambda v: Assertion.equal_to(float(v)),
+    "between": lambda v: Assertion.between(float(v[0]), float(v[1])),
 }
 
 # Rules that default to ``assertion: "== 1.0"`` when no bound is specified.
 _DEFAULT_ASSERTION_RULES = {"is_complete", "has_completeness"}
 
 
+# Built checks keyed by the exact (type-tagged) form of their ``checks`` section; oldest evicted first.
+_COMPILED_CHECKS: dict[Any, tuple[Check, ...]] = {}
+_COMPILED_CHECKS_MAX = 32
+
+# Scalar types a cacheable ``checks`` section may hold; matched exactly, so ``Level.WARNING``,
+# ``1``, ``True`` and ``"1"`` all produce distinct keys.
+_KEY_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), Level})
+
+
 def build_suite_from_yaml(
     source: str | Path,
     ctx: SessionContext | None = None,
@@ -87,7 +98,7 @@ def _build(cfg: dict[str, Any], ctx: SessionContext | None) -> ValidationSuiteBu
     primary_table = data_source_specs[0].table_name if data_source_specs else "data"
 
     if ctx is None:
-        ctx = SessionContext()
+        ctx = _new_session_context(suite_cfg)
     registry = default_source_adapter_registry()
     for source in data_source_specs:
         connection = connection_specs.get(source.connection) if source.connection else None
@@ -97,15 +108,40 @@ def _build(cfg: dict[str, Any], ctx: SessionContext | None) -> ValidationSuiteBu
 
     if "run_parallel" in suite_cfg:
         builder.run_parallel(bool(suite_cfg["run_parallel"]))
+    if "max_parallel" in suite_cfg:
+        builder.max_parallel(int(suite_cfg["max_parallel"]))
 
     checks = cfg.get("checks", [])
-    for check_cfg in checks:
-        builder.add_check(_build_check(check_cfg))
+    builder.add_checks(list(_build_checks(checks)))
 
     _logger.info("Suite '%s' built successfully with %d check(s)", suite_name, len(checks))
     return builder
 
 
+def _new_session_context(suite_cfg: dict[str, Any]) -> SessionContext:
+    """Create the ``SessionContext`` used when the caller does not supply one.
+
+    ``target_partitions`` sets how many partitions DataFusion scans and aggregates
+    in parallel (default: one per CPU); ``parquet_pruning`` toggles row-group
+    pruning from Parquet statistics (default: enabled); ``parquet_pushdown_filters``
+    evaluates ``WHERE`` predicates while decoding Parquet pages and lets DataFusion
+    reorder them by cost (default: disabled).
+    """
+    # Imported here so parsing YAML via ``qualink.config`` does not load DataFusion.
+    from datafusion import SessionConfig, SessionContext
+
+    config = SessionConfig()
+    if suite_cfg.get("target_partitions") is not None:
+        config = config.with_target_partitions(int(suite_cfg["target_partitions"]))
+    if "parquet_pruning" in suite_cfg:
+        config = config.with_parquet_pruning(bool(suite_cfg["parquet_pruning"]))
+    if suite_cfg.get("parquet_pushdown_filters"):
+        config = config.set("datafusion.execution.parquet.pushdown_filters", "true").set(
+            "datafusion.execution.parquet.reorder_filters", "true"
+        )
+    return SessionContext(config)
+
+
 def _register_source(
     ctx: SessionContext,
     source: Any,
@@ -121,15 +157,56 @@ def _register_source(
     registry.prepare(ctx, source, connection)
 
 
+def clear_compiled_checks() -> None:
+    """Forget every cached ``checks`` section, so the next build parses from scratch."""
+    _COMPILED_CHECKS.clear()
+
+
+def _config_key(value: Any) -> Any:
+    """Return a hashable key for *value* that records the exact type of every element.
+
+    Raises ``TypeError`` for anything other than plain YAML data, so such sections
+    bypass the cache.
+    """
+    if type(value) is dict:
+        return (dict, tuple((_config_key(k), _config_key(v)) for k, v in value.items()))
+    if type(value) in (list, tuple):
+        return (type(value), tuple(_config_key(v) for v in value))
+    if type(value) in _KEY_SCALAR_TYPES:
+        return (type(value), value)
+    raise TypeError(f"Uncacheable config value of type {type(value).__name__}")
+
+
+def _build_checks(check_cfgs: list[dict[str, Any]]) -> tuple[Check, ...]:
+    """Build every check, reusing the constraints for a ``checks`` section seen before.
+
+    Constraints are immutable, so repeated builds of the same config (e.g. ``run_yaml``
+    in a loop) share them; each call still gets its own ``Check`` objects, so changing
+    one suite's checks never leaks into another. The cache key keeps every value's
+    type, so only an identical section is reused and validation never depends on
+    earlier builds. Sections that are not plain YAML data are always built afresh.
+    """
+    try:
+        key = _config_key(check_cfgs)
+    except TypeError:
+        return tuple(_build_check(c) for c in check_cfgs)
+    checks = _COMPILED_CHECKS.get(key)
+    if checks is None:
+        checks = tuple(_build_check(c) for c in check_cfgs)
+        if len(_COMPILED_CHECKS) >= _COMPILED_CHECKS_MAX:
+            del _COMPILED_CHECKS[next(iter(_COMPILED_CHECKS))]
+        _COMPILED_CHECKS[key] = checks
+    else:
+        _logger.debug("Reusing %d compiled check(s)", len(checks))
+    return tuple(copy.copy(check) for check in checks)
+
+
 def _build_check(check_cfg: dict[str, Any]) -> Check:
     name = check_cfg.get("name", "unnamed_check")
-    level_str = str(check_cfg.get("level", "error")).lower()
-    level = _LEVEL_MAP.get(level_str)
-    if level is None:
-        _logger.error("Unknown check level: %s", level_str)
-        raise ValueError(f"Unknown check level: {level_str!r}. Use error, warning, or info.")
+    raw_level = check_cfg.get("level", "error")
+    level = raw_level if isinstance(raw_level, Level) else _resolve_level(raw_level)
 
-    _logger.debug("Building check '%s' with level=%s", name, level_str)
+    _logger.debug("Building check '%s' with level=%s", name, level)
     cb = CheckBuilder(name)
     cb.with_level(level)
     if "description" in check_cfg:
@@ -141,6 +218,17 @@ def _build_check(check_cfg: dict[str, Any]) -> Check:
     return cb.build()
 
 
+def _resolve_level(raw: Any) -> Level:
+    level = _LEVEL_MAP.get(raw) if isinstance(raw, str) else None
+    if level is None:
+        level_str = str(raw).lower()
+        level = _LEVEL_MAP.get(level_str)
+        if level is None:
+            _logger.error("Unknown check level: %s", level_str)
+            raise ValueError(f"Unknown check level: {level_str!r}. Use error, warning, or info.")
+    return level
+
+
 def _apply_rule(cb: CheckBuilder, rule: dict[str, Any]) -> None:
     """Dispatch a single YAML rule to the constraint registry.
 
@@ -180,8 +268,8 @@ def _normalise_params(type_name: str, raw: Any) -> dict[str, Any]:
     elif isinstance(raw, dict):
         params = {}
         for k, v in raw.items():
-            if k in _BOUND_KEYS:
-                params["assertion"] = _bound_to_shorthand(k, v)
+            if k in _BOUND_FACTORIES:
+                params["assertion"] = _bound_to_assertion(k, v)
             else:
                 params[k] = v
     else:
@@ -189,7 +277,7 @@ def _normalise_params(type_name: str, raw: Any) -> dict[str, Any]:
 
     # Apply default assertion for rules that need one when none was specified.
     if type_name in _DEFAULT_ASSERTION_RULES and "assertion" not in params:
-        params["assertion"] = "== 1.0"
+        params["assertion"] = EQUAL_TO_ONE
 
     # If 'threshold' was given but no assertion, convert threshold to assertion.
     if "threshold" in params and "assertion" not in params:
@@ -198,12 +286,9 @@ def _normalise_params(type_name: str, raw: Any) -> dict[str, Any]:
     return params
 
 
-def _bound_to_shorthand(key: str, value: Any) -> str:
-    """Convert an inline bound key/value to an assertion shorthand string."""
-    if key == "between":
-        lo, hi = value
-        return f"between {lo} {hi}"
-    op = _BOUND_TO_OP.get(key)
-    if op is None:
+def _bound_to_assertion(key: str, value: Any) -> Assertion:
+    """Convert an inline bound key/value to an :class:`Assertion`."""
+    factory = _BOUND_FACTORIES.get(key)
+    if factory is None:
         raise ValueError(f"Unknown bound key: {key!r}")
-    return f"{op} {value}"
+    return factory(value)
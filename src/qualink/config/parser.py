@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import copy
+import functools
 import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import pyarrow.fs as pafs
@@ -11,6 +13,14 @@ import yaml
 from qualink.constraints.assertion import Assertion
 from qualink.core.logging_mixin import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 _logger = get_logger("config.parser")
 _SUPPORTED_FILESYSTEM_URI_SCHEMES = frozenset({"s3", "gs", "gcs", "az", "abfs", "abfss", "file"})
 
@@ -23,7 +33,7 @@ _SHORTHAND_RE = re.compile(
     re.IGNORECASE,
 )
 
-_OP_MAP: dict[str, str] = {
+_OP_NAMES: dict[str, str] = {
     ">": "greater_than",
     "gt": "greater_than",
     "greater_than": "greater_than",
@@ -39,16 +49,22 @@ _OP_MAP: dict[str, str] = {
     "==": "equal_to",
     "eq": "equal_to",
     "equal_to": "equal_to",
-    "between": "between",
+}
+
+# Operator token -> single-value ``Assertion`` factory, resolved once at import.
+_FACTORIES: dict[str, Callable[[float], Assertion]] = {
+    token: getattr(Assertion, name) for token, name in _OP_NAMES.items()
 }
 
 
-def parse_assertion(raw: str | dict[str, Any]) -> Assertion:
+def parse_assertion(raw: str | dict[str, Any] | Assertion) -> Assertion:
     """Convert a YAML assertion value into an :class:`Assertion` instance.
 
-    Raises :class:`ValueError` on unrecognised input.
+    ``Assertion`` instances are returned unchanged. Raises :class:`ValueError` on unrecognised input.
     """
     _logger.debug("Parsing assertion: %r", raw)
+    if isinstance(raw, Assertion):
+        return raw
     if isinstance(raw, str):
         return _parse_shorthand(raw)
     if isinstance(raw, dict):
@@ -57,69 +73,86 @@ def parse_assertion(raw: str | dict[str, Any]) -> Assertion:
     raise ValueError(f"Cannot parse assertion from {type(raw).__name__}: {raw!r}")
 
 
+# Assertions are frozen, so repeated thresholds (``"== 1.0"``, ``">= 0.95"``) share one instance.
+@functools.lru_cache(maxsize=512)
 def _parse_shorthand(text: str) -> Assertion:
-    m = _SHORTHAND_RE.match(text)
-    if not m:
+    if not (m := _SHORTHAND_RE.match(text)):
         raise ValueError(f"Invalid assertion shorthand: {text!r}")
-    op = _OP_MAP.get(m.group("op").lower())
-    if op is None:
-        raise ValueError(f"Unknown operator in shorthand: {m.group('op')!r}")
-    v1 = float(m.group("v1"))
-    v2 = m.group("v2")
+    op = m["op"].lower()
+    v2 = m["v2"]
     if op == "between":
         if v2 is None:
             raise ValueError("'between' requires two values, e.g. 'between 0 100'")
-        return Assertion.between(v1, float(v2))
-    factory = getattr(Assertion, op)
-    return factory(v1)
+        return Assertion.between(float(m["v1"]), float(v2))
+    factory = _FACTORIES.get(op)
+    if factory is None:
+        raise ValueError(f"Unknown operator in shorthand: {m['op']!r}")
+    return factory(float(m["v1"]))
 
 
 def _parse_dict(d: dict[str, Any]) -> Assertion:
     op_raw = d.get("operator") or d.get("op")
     if op_raw is None:
         raise ValueError(f"Assertion dict must contain 'operator': {d!r}")
-    op = _OP_MAP.get(str(op_raw).lower())
-    if op is None:
-        raise ValueError(f"Unknown assertion operator: {op_raw!r}")
+    op = str(op_raw).lower()
     if op == "between":
         lower = float(d.get("lower", d.get("value", 0)))
         upper = float(d["upper"])
         return Assertion.between(lower, upper)
-    value = float(d["value"])
-    factory = getattr(Assertion, op)
-    return factory(value)
+    factory = _FACTORIES.get(op)
+    if factory is None:
+        raise ValueError(f"Unknown assertion operator: {op_raw!r}")
+    return factory(float(d["value"]))
 
 
 def load_yaml(source: str | Path) -> dict[str, Any]:
     """Load and return a YAML config as a Python dict.
 
     *source* may be a local file path, a filesystem URI, or a raw YAML string.
+    Local files and raw strings are parsed once per process (files are re-read
+    when their modification time or size changes); each call returns a fresh copy.
     """
     if isinstance(source, Path):
         _logger.debug("Loading YAML from Path: %s", source)
-        return _parse_yaml_text(source.read_text(encoding="utf-8"), str(source))
+        return copy.deepcopy(_load_path(source))
 
     text = str(source)
     if _is_filesystem_uri(text):
         _logger.debug("Loading YAML from filesystem URI: %s", text)
         return _load_yaml_from_uri(text)
 
-    if "\n" not in text and len(text) < 260:
+    if "\n" not in text and len(text) < 260 and not _looks_like_inline_yaml(text):
         path = Path(text)
         try:
             if path.is_file():
                 _logger.debug("Loading YAML from file: %s", path)
-                return _parse_yaml_text(path.read_text(encoding="utf-8"), str(path))
+                return copy.deepcopy(_load_path(path))
         except OSError:
             pass
         if _looks_like_yaml_path(text):
             raise FileNotFoundError(f"YAML config file not found: {text}")
     _logger.debug("Parsing YAML from string (%d chars)", len(text))
+    return copy.deepcopy(_parse_inline_yaml(text))
+
+
+def _load_path(path: Path) -> dict[str, Any]:
+    resolved = path.resolve()
+    stat = resolved.stat()
+    return _load_file_cached(str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_file_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    return _parse_yaml_text(Path(path).read_text(encoding="utf-8"), path)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_inline_yaml(text: str) -> dict[str, Any]:
     return _parse_yaml_text(text, "<inline>")
 
 
 def _parse_yaml_text(text: str, source_label: str) -> dict[str, Any]:
-    data = yaml.safe_load(text)
+    data = yaml.load(text, Loader=_SafeLoader)
     if not isinstance(data, dict):
         raise ValueError(f"YAML config from {source_label} must be a mapping at the top level.")
     return data
@@ -129,6 +162,11 @@ def _is_filesystem_uri(source: str) -> bool:
     return urlparse(source).scheme.lower() in _SUPPORTED_FILESYSTEM_URI_SCHEMES
 
 
+def _looks_like_inline_yaml(source: str) -> bool:
+    """Cheap check for one-line YAML documents, which can skip the filesystem probe."""
+    return ": " in source or source.lstrip().startswith(("- ", "{", "["))
+
+
 def _looks_like_yaml_path(source: str) -> bool:
     return Path(source).suffix.lower() in {".yaml", ".yml"}
 
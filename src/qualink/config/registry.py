@@ -5,9 +5,12 @@ from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
 from qualink.config.parser import parse_assertion
+from qualink.constraints.assertion import EQUAL_TO_ONE
 from qualink.core.logging_mixin import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from qualink.core.constraint import Constraint
 
 _logger = get_logger("config.registry")
@@ -28,7 +31,7 @@ class Kind(Enum):
     CUSTOM = auto()  # uses a custom extractor
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstraintDef:
     """One-line specification for a YAML-configurable constraint."""
 
@@ -49,7 +52,7 @@ _DEFS: list[ConstraintDef] = [
         "qualink.constraints.uniqueness:UniquenessConstraint",
         custom_build=lambda cls, p: cls(
             _cols(p),
-            _assert(p) if "assertion" in p else parse_assertion("== 1.0"),
+            _assert(p) if "assertion" in p else EQUAL_TO_ONE,
         ),
     ),
     # columns + assertion
@@ -168,7 +171,7 @@ _DEFS: list[ConstraintDef] = [
         custom_build=lambda cls, p: cls(
             p["column"],
             p["pattern"],
-            _assert(p) if "assertion" in p else parse_assertion("== 1.0"),
+            _assert(p) if "assertion" in p else EQUAL_TO_ONE,
         ),
     ),
     ConstraintDef(
@@ -177,7 +180,7 @@ _DEFS: list[ConstraintDef] = [
         "qualink.constraints.format:FormatConstraint",
         custom_build=lambda cls, p: cls(
             p["column"],
-            _import("qualink.constraints.format:FormatType")[p["format_type"].upper()],
+            _format_type(p["format_type"]),
             threshold=float(p.get("threshold", 1.0)),
             pattern=p.get("pattern"),
         ),
@@ -272,11 +275,13 @@ for _d in _DEFS:
 def build_constraint(type_name: str, params: dict[str, Any]) -> Constraint:
     """Look up *type_name* and build a constraint from *params*."""
     _logger.debug("Looking up constraint type: %s", type_name)
-    defn = _INDEX.get(type_name.lower())
+    # Registered names are lower-case, so the usual spelling needs no ``lower()`` copy.
+    defn = _INDEX.get(type_name) or _INDEX.get(type_name.lower())
     if defn is None:
-        _logger.error("Unknown constraint type: %s. Available: %s", type_name, sorted(_INDEX))
-        raise ValueError(f"Unknown constraint type: {type_name!r}. Available: {sorted(_INDEX)}")
-    constraint = _build(defn, params)
+        available = sorted(_INDEX)
+        _logger.error("Unknown constraint type: %s. Available: %s", type_name, available)
+        raise ValueError(f"Unknown constraint type: {type_name!r}. Available: {available}")
+    constraint = _build(defn, _Params(type_name, params))
     _logger.debug("Built constraint: %s", constraint)
     return constraint
 
@@ -286,44 +291,70 @@ def available_types() -> list[str]:
     return sorted(_INDEX)
 
 
+class _Params(dict[str, Any]):
+    """YAML params whose missing keys raise a ValueError naming the constraint and field.
+
+    Only lookups of the params themselves are reported this way; a ``KeyError`` raised
+    anywhere else while building still propagates unchanged.
+    """
+
+    __slots__ = ("_type_name",)
+
+    def __init__(self, type_name: str, params: dict[str, Any]) -> None:
+        super().__init__(params)
+        self._type_name = type_name
+
+    def __missing__(self, key: str) -> Any:
+        raise ValueError(f"Constraint {self._type_name!r} is missing required field {key!r}")
+
+
 def _build(defn: ConstraintDef, params: dict[str, Any]) -> Constraint:
-    cls = _import(defn.import_path)
+    handler = _KIND_BUILDERS.get(defn.kind)
+    if handler is None:  # pragma: no cover
+        raise ValueError(f"Unhandled kind: {defn.kind}")
+    return handler(_CLASSES.get(defn.names[0]) or _resolve_cls(defn), defn, params)
 
-    match defn.kind:
-        case Kind.COLUMN_THRESHOLD:
-            return cls(params["column"], threshold=float(params.get("threshold", 1.0)))
 
-        case Kind.COLUMNS_THRESHOLD:
-            return cls(_cols(params), threshold=float(params.get("threshold", 1.0)))
+# ── per-kind constructors ────────────────────────────────────────────────
 
-        case Kind.COLUMN_ASSERTION:
-            return cls(params["column"], _assert(params))
 
-        case Kind.COLUMNS_ASSERTION:
-            return cls(_cols(params), _assert(params))
+def _build_stat(cls: Any, defn: ConstraintDef, params: dict[str, Any]) -> Constraint:
+    stat = _STATS.get(defn.names[0]) or _resolve_stat(defn)
+    return cls(params["column"], stat, _assert(params))
 
-        case Kind.TWO_COLUMN_ASSERTION:
-            return cls(params["column_a"], params["column_b"], _assert(params))
 
-        case Kind.ASSERTION_ONLY:
-            return cls(_assert(params))
+_KIND_BUILDERS: dict[Kind, Callable[[Any, ConstraintDef, dict[str, Any]], Constraint]] = {
+    Kind.COLUMN_THRESHOLD: lambda cls, _d, p: cls(p["column"], threshold=float(p.get("threshold", 1.0))),
+    Kind.COLUMNS_THRESHOLD: lambda cls, _d, p: cls(_cols(p), threshold=float(p.get("threshold", 1.0))),
+    Kind.COLUMN_ASSERTION: lambda cls, _d, p: cls(p["column"], _assert(p)),
+    Kind.COLUMNS_ASSERTION: lambda cls, _d, p: cls(_cols(p), _assert(p)),
+    Kind.TWO_COLUMN_ASSERTION: lambda cls, _d, p: cls(p["column_a"], p["column_b"], _assert(p)),
+    Kind.ASSERTION_ONLY: lambda cls, _d, p: cls(_assert(p)),
+    Kind.COLUMN_ONLY: lambda cls, _d, p: cls(p["column"]),
+    Kind.EXPRESSION: lambda cls, _d, p: cls(p.get("expression") or p.get("sql", "")),
+    Kind.STAT: _build_stat,
+    Kind.CUSTOM: lambda cls, d, p: d.custom_build(cls, p),
+}
 
-        case Kind.COLUMN_ONLY:
-            return cls(params["column"])
 
-        case Kind.EXPRESSION:
-            return cls(params.get("expression") or params.get("sql", ""))
+# Constraint classes and ``StatisticType`` members resolved on first build, keyed by each
+# definition's primary name.
+_CLASSES: dict[str, Any] = {}
+_STATS: dict[str, Any] = {}
 
-        case Kind.STAT:
-            from qualink.constraints.statistics import StatisticType
 
-            stat = StatisticType[defn.extra["stat"]]
-            return cls(params["column"], stat, _assert(params))
+def _resolve_cls(defn: ConstraintDef) -> Any:
+    """Import the class behind *defn* on first use and remember it in ``_CLASSES``."""
+    cls = _import(defn.import_path)
+    _CLASSES[defn.names[0]] = cls
+    return cls
 
-        case Kind.CUSTOM:
-            return defn.custom_build(cls, params)
 
-    raise ValueError(f"Unhandled kind: {defn.kind}")  # pragma: no cover
+def _resolve_stat(defn: ConstraintDef) -> Any:
+    """Look up the ``StatisticType`` named by ``extra["stat"]`` once and remember it in ``_STATS``."""
+    stat = _import("qualink.constraints.statistics:StatisticType")[defn.extra["stat"]]
+    _STATS[defn.names[0]] = stat
+    return stat
 
 
 _IMPORT_CACHE: dict[str, Any] = {}
@@ -342,19 +373,27 @@ def _import(path: str) -> Any:
     return obj
 
 
-def _cols(params: dict[str, Any]) -> list[str]:
-    """Normalise ``column`` (str) or ``columns`` (list) into a list."""
-    if "columns" in params:
-        c = params["columns"]
-        return c if isinstance(c, list) else [c]
-    if "column" in params:
-        return [params["column"]]
+def _cols(params: dict[str, Any]) -> tuple[str, ...]:
+    """Normalise ``column`` (str) or ``columns`` (list) into a tuple."""
+    columns = params.get("columns")
+    if columns is not None:
+        return tuple(columns) if isinstance(columns, list) else (columns,)
+    column = params.get("column")
+    if column is not None:
+        return (column,)
     raise ValueError("Constraint requires 'column' or 'columns'")
 
 
+def _format_type(value: str) -> Any:
+    """Resolve a YAML ``format_type`` name to its ``FormatType`` member."""
+    format_types = _import("qualink.constraints.format:FormatType")
+    try:
+        return format_types[value.upper()]
+    except KeyError:
+        available = sorted(member.value for member in format_types)
+        raise ValueError(f"Unknown format_type: {value!r}. Available: {available}") from None
+
+
 def _assert(params: dict[str, Any]) -> Any:
     """Extract and parse the ``assertion`` field."""
-    raw = params.get("assertion")
-    if raw is None:
-        raise ValueError("Constraint requires an 'assertion' field")
-    return parse_assertion(raw)
+    return parse_assertion(params["assertion"])
@@ -1,5 +1,32 @@
-from qualink.constraints.assertion import Assertion
-from qualink.constraints.completeness import CompletenessConstraint
-from qualink.constraints.uniqueness import UniquenessConstraint
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from qualink.constraints.assertion import Assertion
+    from qualink.constraints.completeness import CompletenessConstraint
+    from qualink.constraints.uniqueness import UniquenessConstraint
 
 __all__ = ["Assertion", "CompletenessConstraint", "UniquenessConstraint"]
+
+# Re-exports resolved on first access, so importing one constraint submodule
+# does not load the others through this package.
+_LAZY: dict[str, str] = {
+    "Assertion": "qualink.constraints.assertion",
+    "CompletenessConstraint": "qualink.constraints.completeness",
+    "UniquenessConstraint": "qualink.constraints.uniqueness",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
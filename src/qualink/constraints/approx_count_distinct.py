@@ -8,26 +8,36 @@ if TYPE_CHECKING:
     from qualink.constraints.assertion import Assertion
 
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
 
 
-class ApproxCountDistinctConstraint(Constraint):
+class ApproxCountDistinctConstraint(FusableConstraint):
     """Validates that the approximate distinct count of *column* satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_column", "_fragment", "_hint", "_name")
+
     def __init__(self, column: str, assertion: Assertion, *, hint: str = "") -> None:
         self._column = column
         self._assertion = assertion
         self._hint = hint
+        self._fragment = f'CAST(APPROX_DISTINCT("{self._column}") AS DOUBLE)'
+        self._name = f"ApproxCountDistinct({self._column})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        sql = f'SELECT CAST(APPROX_DISTINCT("{self._column}") AS DOUBLE) AS acd FROM {table_name}'
+        sql = f"SELECT {self.sql_fragment()} AS acd FROM {table_name}"
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        value = float(rows[0].column("acd")[0].as_py())
+        return self.evaluate_from_row(await query_scalar(ctx, sql))
+
+    def sql_fragment(self) -> str:
+        return self._fragment
+
+    def evaluate_from_row(self, value: float) -> ConstraintResult:
+        value = float(value)
         self.logger.debug("Metric value: %s", value)
         passed = self._assertion.evaluate(value)
         result = ConstraintResult(
@@ -50,7 +60,7 @@ class ApproxCountDistinctConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"ApproxCountDistinct({self._column})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(name=self.name(), column=self._column)
@@ -12,12 +12,15 @@ from qualink.core.constraint import (
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    query_scalar,
 )
 
 
 class ApproxQuantileConstraint(Constraint):
     """Validates that an approximate quantile of *column* satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_column", "_hint", "_name", "_quantile")
+
     def __init__(self, column: str, quantile: float, assertion: Assertion, *, hint: str = "") -> None:
         if not 0.0 <= quantile <= 1.0:
             raise ValueError(f"quantile must be in [0, 1], got {quantile}")
@@ -25,6 +28,7 @@ class ApproxQuantileConstraint(Constraint):
         self._quantile = quantile
         self._assertion = assertion
         self._hint = hint
+        self._name = f"ApproxQuantile({self._column}, {self._quantile})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         sql = (
@@ -32,8 +36,7 @@ class ApproxQuantileConstraint(Constraint):
             f"AS DOUBLE) AS q FROM {table_name}"
         )
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        raw = rows[0].column("q")[0].as_py()
+        raw = await query_scalar(ctx, sql)
         if raw is None:
             self.logger.warning("Column '%s' produced NULL for quantile %s", self._column, self._quantile)
             return ConstraintResult(
@@ -64,7 +67,7 @@ class ApproxQuantileConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"ApproxQuantile({self._column}, {self._quantile})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(name=self.name(), column=self._column)
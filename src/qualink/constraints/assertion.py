@@ -77,3 +77,8 @@ class Assertion:
 
     def __str__(self) -> str:
         return self._label or repr(self)
+
+
+# Default bound for the ratio-style shortcuts (completeness, uniqueness, ...). Assertions
+# are frozen, so every caller shares this one instance.
+EQUAL_TO_ONE = Assertion.equal_to(1.0)
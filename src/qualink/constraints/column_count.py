@@ -13,19 +13,21 @@ from qualink.core.constraint import (
     ConstraintResult,
     ConstraintStatus,
 )
+from qualink.core.run_cache import table_schema
 
 
 class ColumnCountConstraint(Constraint):
     """Validates that the number of columns in the table satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_name")
+
     def __init__(self, assertion: Assertion) -> None:
         self._assertion = assertion
+        self._name = f"ColumnCount({self._assertion})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        sql = f"SELECT * FROM {table_name} LIMIT 0"
-        self.logger.debug("Checking schema via: %s", sql)
-        df = ctx.sql(sql)
-        schema = df.schema()
+        self.logger.debug("Checking schema of table '%s'", table_name)
+        schema = table_schema(ctx, table_name)
         col_count = float(len(schema))
         self.logger.debug("Metric value: %s", col_count)
 
@@ -45,7 +47,7 @@ class ColumnCountConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"ColumnCount({self._assertion})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
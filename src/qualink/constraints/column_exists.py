@@ -11,19 +11,22 @@ from qualink.core.constraint import (
     ConstraintResult,
     ConstraintStatus,
 )
+from qualink.core.run_cache import table_schema
 
 
 class ColumnExistsConstraint(Constraint):
     """Validates that *column* exists in the table schema."""
 
+    __slots__ = ("_column", "_hint", "_name")
+
     def __init__(self, column: str, *, hint: str = "") -> None:
         self._column = column
         self._hint = hint
+        self._name = f"ColumnExists({self._column})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        sql = f"SELECT * FROM {table_name} LIMIT 0"
-        self.logger.debug("Checking schema via: %s", sql)
-        schema = ctx.sql(sql).schema()
+        self.logger.debug("Checking schema of table '%s'", table_name)
+        schema = table_schema(ctx, table_name)
         col_names = [schema.field(i).name for i in range(len(schema))]
         exists = self._column in col_names
         self.logger.debug("Available columns: %s", col_names)
@@ -45,7 +48,7 @@ class ColumnExistsConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"ColumnExists({self._column})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(name=self.name(), column=self._column)
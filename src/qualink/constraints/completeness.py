@@ -3,10 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
 
 if TYPE_CHECKING:
@@ -15,23 +16,27 @@ if TYPE_CHECKING:
     from qualink.constraints.assertion import Assertion
 
 
-class CompletenessConstraint(Constraint):
+class CompletenessConstraint(FusableConstraint):
     """Validates that the completeness fraction of *column* satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_column", "_fragment", "_name")
+
     def __init__(self, column: str, assertion: Assertion) -> None:
         self._column = column
         self._assertion = assertion
+        self._fragment = f'CAST(COUNT("{self._column}") AS DOUBLE) / CAST(GREATEST(COUNT(*), 1) AS DOUBLE)'
+        self._name = f"Completeness({self._column})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        sql = (
-            f'SELECT CAST(COUNT("{self._column}") AS DOUBLE) '
-            f"/ CAST(GREATEST(COUNT(*), 1) AS DOUBLE) AS completeness "
-            f"FROM {table_name}"
-        )
+        sql = f"SELECT {self.sql_fragment()} AS completeness FROM {table_name}"
         self.logger.debug("Executing SQL: %s", sql)
-        df = ctx.sql(sql)
-        rows = df.collect()
-        completeness: float = rows[0].column("completeness")[0].as_py()
+        return self.evaluate_from_row(await query_scalar(ctx, sql))
+
+    def sql_fragment(self) -> str:
+        return self._fragment
+
+    def evaluate_from_row(self, value: float) -> ConstraintResult:
+        completeness = value
         self.logger.debug("Metric value: %s", completeness)
 
         passed = self._assertion.evaluate(completeness)
@@ -54,7 +59,7 @@ class CompletenessConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"Completeness({self._column})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
@@ -8,16 +8,19 @@ if TYPE_CHECKING:
     from qualink.constraints.assertion import Assertion
 
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
 
 
-class ComplianceConstraint(Constraint):
+class ComplianceConstraint(FusableConstraint):
     """Validates that the fraction of rows where *predicate* is true satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_fragment", "_hint", "_label", "_name", "_predicate")
+
     def __init__(
         self,
         name_label: str,
@@ -30,15 +33,18 @@ class ComplianceConstraint(Constraint):
         self._predicate = predicate
         self._assertion = assertion
         self._hint = hint
+        self._fragment = f"AVG(CASE WHEN {self._predicate} THEN 1.0 ELSE 0.0 END)"
+        self._name = f"Compliance({self._label})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        sql = (
-            f"SELECT AVG(CASE WHEN {self._predicate} THEN 1.0 ELSE 0.0 END) AS compliance "
-            f"FROM {table_name}"
-        )
+        sql = f"SELECT {self.sql_fragment()} AS compliance FROM {table_name}"
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        value: float = rows[0].column("compliance")[0].as_py()
+        return self.evaluate_from_row(await query_scalar(ctx, sql))
+
+    def sql_fragment(self) -> str:
+        return self._fragment
+
+    def evaluate_from_row(self, value: float) -> ConstraintResult:
         self.logger.debug("Metric value: %s", value)
         passed = self._assertion.evaluate(value)
         result = ConstraintResult(
@@ -60,7 +66,7 @@ class ComplianceConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"Compliance({self._label})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(name=self.name(), description=self._predicate)
@@ -8,6 +8,7 @@ from qualink.core.constraint import (
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    query_scalar,
 )
 
 if TYPE_CHECKING:
@@ -19,6 +20,8 @@ if TYPE_CHECKING:
 class CorrelationConstraint(Constraint):
     """Validates that the Pearson correlation of *column_a* and *column_b* satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_col_a", "_col_b", "_hint", "_name")
+
     def __init__(
         self,
         column_a: str,
@@ -31,6 +34,7 @@ class CorrelationConstraint(Constraint):
         self._col_b = column_b
         self._assertion = assertion
         self._hint = hint
+        self._name = f"Correlation({self._col_a}, {self._col_b})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         a, b = self._col_a, self._col_b
@@ -39,8 +43,7 @@ class CorrelationConstraint(Constraint):
             f'FROM {table_name} WHERE "{a}" IS NOT NULL AND "{b}" IS NOT NULL'
         )
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        raw = rows[0].column("corr")[0].as_py()
+        raw = await query_scalar(ctx, sql)
         value = float(raw) if raw is not None and not math.isnan(raw) else 0.0
         self.logger.debug("Metric value: %s", value)
         passed = self._assertion.evaluate(value)
@@ -64,7 +67,7 @@ class CorrelationConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"Correlation({self._col_a}, {self._col_b})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(name=self.name())
@@ -10,6 +10,7 @@ from qualink.core.constraint import (
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    query_scalar,
 )
 
 
@@ -20,19 +21,19 @@ class CustomSqlConstraint(Constraint):
     passes when the ratio of matching rows equals 1.0.
     """
 
+    __slots__ = ("_expression", "_hint", "_name")
+
     def __init__(self, sql_expression: str, hint: str = "") -> None:
         self._expression = sql_expression
         self._hint = hint
+        self._name = f"CustomSQL({self._hint or self._expression[:50]})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         sql = (
-            f"SELECT AVG(CASE WHEN {self._expression} THEN 1.0 ELSE 0.0 END) AS compliance "
-            f"FROM {table_name}"
+            f"SELECT AVG(CASE WHEN {self._expression} THEN 1.0 ELSE 0.0 END) AS compliance FROM {table_name}"
         )
         self.logger.debug("Executing SQL: %s", sql)
-        df = ctx.sql(sql)
-        rows = df.collect()
-        compliance: float = rows[0].column("compliance")[0].as_py()
+        compliance: float = await query_scalar(ctx, sql)
         self.logger.debug("Metric value: %s", compliance)
 
         passed = compliance == 1.0
@@ -53,8 +54,7 @@ class CustomSqlConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        label = self._hint or self._expression[:50]
-        return f"CustomSQL({label})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
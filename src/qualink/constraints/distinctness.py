@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from datafusion import SessionContext
 
     from qualink.constraints.assertion import Assertion
@@ -12,6 +14,7 @@ from qualink.core.constraint import (
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    query_scalar,
 )
 
 
@@ -21,10 +24,13 @@ class DistinctnessConstraint(Constraint):
     Distinctness = COUNT(DISTINCT cols) / COUNT(*)
     """
 
-    def __init__(self, columns: list[str], assertion: Assertion, *, hint: str = "") -> None:
-        self._columns = list(columns)
+    __slots__ = ("_assertion", "_columns", "_hint", "_name")
+
+    def __init__(self, columns: Iterable[str], assertion: Assertion, *, hint: str = "") -> None:
+        self._columns = tuple(columns)
         self._assertion = assertion
         self._hint = hint
+        self._name = f"Distinctness({', '.join(self._columns)})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         cols = ", ".join(f'"{c}"' for c in self._columns)
@@ -34,8 +40,7 @@ class DistinctnessConstraint(Constraint):
             f"FROM {table_name}"
         )
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        value: float = rows[0].column("distinctness")[0].as_py()
+        value: float = await query_scalar(ctx, sql)
         self.logger.debug("Metric value: %s", value)
         passed = self._assertion.evaluate(value)
         col_label = ", ".join(self._columns)
@@ -59,7 +64,7 @@ class DistinctnessConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"Distinctness({', '.join(self._columns)})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
@@ -6,11 +6,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from datafusion import SessionContext
 
+from qualink.constraints.pattern_match import match_ratio_fragment
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
 
 _BUILTIN_PATTERNS: dict[str, str] = {
@@ -35,9 +37,11 @@ class FormatType(Enum):
     IPV4 = "ipv4"
 
 
-class FormatConstraint(Constraint):
+class FormatConstraint(FusableConstraint):
     """Validates that at least *threshold* fraction of *column* values match a pattern."""
 
+    __slots__ = ("_column", "_format_type", "_fragment", "_name", "_pattern", "_threshold")
+
     def __init__(
         self,
         column: str,
@@ -52,45 +56,45 @@ class FormatConstraint(Constraint):
         self._format_type = format_type
         self._pattern = pattern or _BUILTIN_PATTERNS.get(format_type.value, "")
         self._threshold = threshold
+        # Built once: the fused-query pass asks for the fragment several times per run.
+        self._fragment = match_ratio_fragment(column, self._pattern)
+        self._name = f"Format({self._column}, {self._format_type.value})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        escaped = self._pattern.replace("'", "''")
-        col_expr = f'CAST("{self._column}" AS VARCHAR)'
-        sql = (
-            f"SELECT AVG(CASE WHEN {col_expr} ~ '{escaped}' "
-            f"THEN 1.0 ELSE 0.0 END) AS compliance "
-            f'FROM {table_name} WHERE "{self._column}" IS NOT NULL'
-        )
+        sql = f"SELECT {self.sql_fragment()} AS compliance FROM {table_name}"
         self.logger.info("Executing SQL: %s", sql)
-        df = ctx.sql(sql)
-        rows = df.collect()
-        compliance: float = rows[0].column("compliance")[0].as_py()
-        self.logger.debug("Metric value: %s", compliance)
+        return self.evaluate_from_row(await query_scalar(ctx, sql))
+
+    def sql_fragment(self) -> str:
+        return self._fragment
+
+    def evaluate_from_row(self, value: float) -> ConstraintResult:
+        self.logger.debug("Metric value: %s", value)
 
-        passed = compliance >= self._threshold
+        passed = value >= self._threshold
         result = ConstraintResult(
             status=ConstraintStatus.SUCCESS if passed else ConstraintStatus.FAILURE,
-            metric=compliance,
+            metric=value,
             message=(
                 ""
                 if passed
                 else (
                     f"Format compliance of '{self._column}' ({self._format_type.value}) "
-                    f"is {compliance:.4f}, expected >= {self._threshold}"
+                    f"is {value:.4f}, expected >= {self._threshold}"
                 )
             ),
             constraint_name=self.name(),
         )
         if passed:
-            self.logger.info("Constraint %s passed (metric=%.4f)", self.name(), compliance)
+            self.logger.info("Constraint %s passed (metric=%.4f)", self.name(), value)
         else:
             self.logger.info(
-                "Constraint %s failed (metric=%.4f, expected >= %s)", self.name(), compliance, self._threshold
+                "Constraint %s failed (metric=%.4f, expected >= %s)", self.name(), value, self._threshold
             )
         return result
 
     def name(self) -> str:
-        return f"Format({self._column}, {self._format_type.value})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
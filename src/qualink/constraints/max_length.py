@@ -8,37 +8,44 @@ if TYPE_CHECKING:
     from qualink.constraints.assertion import Assertion
 
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
 
 
-class MaxLengthConstraint(Constraint):
+class MaxLengthConstraint(FusableConstraint):
     """Validates that the maximum string length of *column* satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_column", "_fragment", "_hint", "_name")
+
     def __init__(self, column: str, assertion: Assertion, *, hint: str = "") -> None:
         self._column = column
         self._assertion = assertion
         self._hint = hint
+        # MAX skips NULLs, so no IS NOT NULL filter is needed and the fragment can be fused.
+        self._fragment = f'CAST(MAX(LENGTH("{self._column}")) AS DOUBLE)'
+        self._name = f"MaxLength({self._column})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        sql = (
-            f'SELECT CAST(MAX(LENGTH("{self._column}")) AS DOUBLE) AS max_len '
-            f'FROM {table_name} WHERE "{self._column}" IS NOT NULL'
-        )
+        sql = f"SELECT {self.sql_fragment()} AS max_len FROM {table_name}"
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        raw = rows[0].column("max_len")[0].as_py()
-        if raw is None:
+        return self.evaluate_from_row(await query_scalar(ctx, sql))
+
+    def sql_fragment(self) -> str:
+        return self._fragment
+
+    def evaluate_from_row(self, value: float | None) -> ConstraintResult:
+        if value is None:
             self.logger.warning("Column '%s' has no non-null values for MaxLength", self._column)
             return ConstraintResult(
                 status=ConstraintStatus.FAILURE,
                 message=f"Column '{self._column}' has no non-null values",
                 constraint_name=self.name(),
             )
-        value = float(raw)
+        value = float(value)
         self.logger.debug("Metric value: %s", value)
         passed = self._assertion.evaluate(value)
         result = ConstraintResult(
@@ -61,7 +68,7 @@ class MaxLengthConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"MaxLength({self._column})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(name=self.name(), column=self._column)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -8,16 +9,60 @@ if TYPE_CHECKING:
     from qualink.constraints.assertion import Assertion
 
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
 
 
-class PatternMatchConstraint(Constraint):
+def _is_literal(text: str) -> bool:
+    return bool(text) and re.escape(text) == text
+
+
+def pattern_predicate(column: str, pattern: str) -> str:
+    """SQL predicate that is true where *column* matches the regex *pattern*.
+
+    Patterns without regex metacharacters are plain substring searches, so they
+    use ``strpos`` instead of the regex engine. Literals anchored with ``^`` and/or
+    ``$`` become ``starts_with``, ``ends_with`` or an equality test.
+    """
+    col_expr = f'CAST("{column}" AS VARCHAR)'
+    if _is_literal(pattern):
+        escaped = pattern.replace("'", "''")
+        return f"strpos({col_expr}, '{escaped}') > 0"
+    anchored_start = pattern.startswith("^")
+    anchored_end = pattern.endswith("$")
+    literal = pattern[anchored_start : len(pattern) - anchored_end]
+    if (anchored_start or anchored_end) and _is_literal(literal):
+        escaped = literal.replace("'", "''")
+        if anchored_start and anchored_end:
+            return f"{col_expr} = '{escaped}'"
+        func = "starts_with" if anchored_start else "ends_with"
+        return f"{func}({col_expr}, '{escaped}')"
+    escaped = pattern.replace("'", "''")
+    return f"{col_expr} ~ '{escaped}'"
+
+
+def match_ratio_fragment(column: str, pattern: str) -> str:
+    """Aggregate fragment for the fraction of non-null *column* values matching *pattern*.
+
+    ``COUNT(*) FILTER`` counts matches from the predicate's boolean mask rather than
+    branching per row through ``CASE``. ``NULLIF`` keeps an all-null column at
+    ``NULL`` rather than dividing by zero.
+    """
+    return (
+        f"CAST(COUNT(*) FILTER (WHERE {pattern_predicate(column, pattern)}) AS DOUBLE) "
+        f'/ CAST(NULLIF(COUNT("{column}"), 0) AS DOUBLE)'
+    )
+
+
+class PatternMatchConstraint(FusableConstraint):
     """Validates that the fraction of *column* values matching *pattern* satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_column", "_fragment", "_hint", "_name", "_pattern")
+
     def __init__(
         self,
         column: str,
@@ -30,18 +75,18 @@ class PatternMatchConstraint(Constraint):
         self._pattern = pattern
         self._assertion = assertion
         self._hint = hint
+        self._fragment = match_ratio_fragment(self._column, self._pattern)
+        self._name = f"PatternMatch({self._column}, {self._pattern!r})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        escaped = self._pattern.replace("'", "''")
-        col_expr = f'CAST("{self._column}" AS VARCHAR)'
-        sql = (
-            f"SELECT AVG(CASE WHEN {col_expr} ~ '{escaped}' "
-            f"THEN 1.0 ELSE 0.0 END) AS match_ratio "
-            f'FROM {table_name} WHERE "{self._column}" IS NOT NULL'
-        )
+        sql = f"SELECT {self.sql_fragment()} AS match_ratio FROM {table_name}"
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        value: float = rows[0].column("match_ratio")[0].as_py()
+        return self.evaluate_from_row(await query_scalar(ctx, sql))
+
+    def sql_fragment(self) -> str:
+        return self._fragment
+
+    def evaluate_from_row(self, value: float) -> ConstraintResult:
         self.logger.debug("Metric value: %s", value)
         passed = self._assertion.evaluate(value)
         result = ConstraintResult(
@@ -64,7 +109,7 @@ class PatternMatchConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"PatternMatch({self._column}, {self._pattern!r})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(name=self.name(), column=self._column)
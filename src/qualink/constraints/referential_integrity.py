@@ -19,6 +19,17 @@ if TYPE_CHECKING:
 class ReferentialIntegrityConstraint(Constraint):
     """Validates referential integrity between two tables via ReferentialIntegrity."""
 
+    __slots__ = (
+        "_assertion",
+        "_child_column",
+        "_child_table",
+        "_hint",
+        "_name",
+        "_parent_column",
+        "_parent_table",
+        "_ri",
+    )
+
     def __init__(
         self,
         child_table: str,
@@ -34,6 +45,12 @@ class ReferentialIntegrityConstraint(Constraint):
         self._parent_column = parent_column
         self._assertion = assertion
         self._hint = hint
+        # Built once so its SQL is assembled at construction, not per evaluation.
+        self._ri = ReferentialIntegrity(child_table, child_column, parent_table, parent_column)
+        self._name = (
+            f"ReferentialIntegrity({self._child_table}.{self._child_column}"
+            f" -> {self._parent_table}.{self._parent_column})"
+        )
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         self.logger.debug(
@@ -43,10 +60,7 @@ class ReferentialIntegrityConstraint(Constraint):
             self._parent_table,
             self._parent_column,
         )
-        ri = ReferentialIntegrity(
-            self._child_table, self._child_column, self._parent_table, self._parent_column
-        )
-        result = await ri.run(ctx)
+        result = await self._ri.run(ctx)
         self.logger.debug("Match ratio: %s", result.match_ratio)
         passed = self._assertion.evaluate(result.match_ratio)
         cr = ConstraintResult(
@@ -74,10 +88,7 @@ class ReferentialIntegrityConstraint(Constraint):
         return cr
 
     def name(self) -> str:
-        return (
-            f"ReferentialIntegrity({self._child_table}.{self._child_column}"
-            f" -> {self._parent_table}.{self._parent_column})"
-        )
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
@@ -19,16 +19,20 @@ if TYPE_CHECKING:
 class RowCountMatchConstraint(Constraint):
     """Validates row count match between two tables via RowCountMatch."""
 
+    __slots__ = ("_assertion", "_hint", "_name", "_rcm", "_table_a", "_table_b")
+
     def __init__(self, table_a: str, table_b: str, assertion: Assertion, hint: str = "") -> None:
         self._table_a = table_a
         self._table_b = table_b
         self._assertion = assertion
         self._hint = hint
+        # Built once so its SQL is assembled at construction, not per evaluation.
+        self._rcm = RowCountMatch(table_a, table_b)
+        self._name = f"RowCountMatch({self._table_a} vs {self._table_b})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         self.logger.debug("Running row count match: %s vs %s", self._table_a, self._table_b)
-        rcm = RowCountMatch(self._table_a, self._table_b)
-        result = await rcm.run(ctx)
+        result = await self._rcm.run(ctx)
         self.logger.debug("Row count ratio: %s (a=%d, b=%d)", result.ratio, result.count_a, result.count_b)
         passed = self._assertion.evaluate(result.ratio)
         cr = ConstraintResult(
@@ -50,7 +54,7 @@ class RowCountMatchConstraint(Constraint):
         return cr
 
     def name(self) -> str:
-        return f"RowCountMatch({self._table_a} vs {self._table_b})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
@@ -19,11 +19,14 @@ if TYPE_CHECKING:
 class SchemaMatchConstraint(Constraint):
     """Validates schema match between two tables via SchemaMatch."""
 
+    __slots__ = ("_assertion", "_hint", "_name", "_table_a", "_table_b")
+
     def __init__(self, table_a: str, table_b: str, assertion: Assertion, hint: str = "") -> None:
         self._table_a = table_a
         self._table_b = table_b
         self._assertion = assertion
         self._hint = hint
+        self._name = f"SchemaMatch({self._table_a} vs {self._table_b})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         self.logger.debug("Running schema match: %s vs %s", self._table_a, self._table_b)
@@ -59,7 +62,7 @@ class SchemaMatchConstraint(Constraint):
         return cr
 
     def name(self) -> str:
-        return f"SchemaMatch({self._table_a} vs {self._table_b})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
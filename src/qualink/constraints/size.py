@@ -8,25 +8,40 @@ if TYPE_CHECKING:
     from qualink.constraints.assertion import Assertion
 
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
+from qualink.core.run_cache import ROW_COUNT_SQL, cached_value, store_value
 
 
-class SizeConstraint(Constraint):
+class SizeConstraint(FusableConstraint):
     """Validates that the row count of the table satisfies *assertion*."""
 
+    __slots__ = ("_assertion", "_name")
+
     def __init__(self, assertion: Assertion) -> None:
         self._assertion = assertion
+        self._name = f"Size({self._assertion})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        sql = f"SELECT CAST(COUNT(*) AS DOUBLE) AS row_count FROM {table_name}"
-        self.logger.debug("Executing SQL: %s", sql)
-        df = ctx.sql(sql)
-        rows = df.collect()
-        count = float(rows[0].column("row_count")[0].as_py())
+        count = cached_value(table_name, ROW_COUNT_SQL)
+        if count is None:
+            sql = f"SELECT {ROW_COUNT_SQL} AS row_count FROM {table_name}"
+            self.logger.debug("Executing SQL: %s", sql)
+            count = await query_scalar(ctx, sql)
+            store_value(table_name, ROW_COUNT_SQL, count)
+        else:
+            self.logger.debug("Using cached row count for '%s'", table_name)
+        return self.evaluate_from_row(count)
+
+    def sql_fragment(self) -> str:
+        return ROW_COUNT_SQL
+
+    def evaluate_from_row(self, value: float) -> ConstraintResult:
+        count = float(value)
         self.logger.debug("Metric value: %s", count)
 
         passed = self._assertion.evaluate(count)
@@ -45,7 +60,7 @@ class SizeConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"Size({self._assertion})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
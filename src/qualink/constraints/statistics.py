@@ -9,10 +9,11 @@ if TYPE_CHECKING:
     from qualink.constraints.assertion import Assertion
 
 from qualink.core.constraint import (
-    Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_scalar,
 )
 
 
@@ -35,22 +36,27 @@ class StatisticType(Enum):
         return self.value
 
 
-class StatisticalConstraint(Constraint):
+class StatisticalConstraint(FusableConstraint):
     """Computes a SQL aggregate on *column* and asserts against *assertion*."""
 
+    __slots__ = ("_assertion", "_column", "_fragment", "_name", "_stat_type")
+
     def __init__(self, column: str, stat_type: StatisticType, assertion: Assertion) -> None:
         self._column = column
         self._stat_type = stat_type
         self._assertion = assertion
+        self._fragment = f'CAST({self._stat_type.sql_fn}("{self._column}") AS DOUBLE)'
+        self._name = f"{self._stat_type.name}({self._column})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        fn = self._stat_type.sql_fn
-        sql = f'SELECT CAST({fn}("{self._column}") AS DOUBLE) AS metric FROM {table_name}'
+        sql = f"SELECT {self.sql_fragment()} AS metric FROM {table_name}"
         self.logger.debug("Executing SQL: %s", sql)
-        df = ctx.sql(sql)
-        rows = df.collect()
-        value = rows[0].column("metric")[0].as_py()
+        return self.evaluate_from_row(await query_scalar(ctx, sql))
+
+    def sql_fragment(self) -> str:
+        return self._fragment
 
+    def evaluate_from_row(self, value: float | None) -> ConstraintResult:
         if value is None:
             self.logger.warning("Column '%s' produced NULL for %s", self._column, self._stat_type.name)
             return ConstraintResult(
@@ -82,7 +88,7 @@ class StatisticalConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"{self._stat_type.name}({self._column})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from datafusion import SessionContext
 
     from qualink.constraints.assertion import Assertion
@@ -12,6 +14,7 @@ from qualink.core.constraint import (
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    query_scalar,
 )
 
 
@@ -21,31 +24,34 @@ class UniqueValueRatioConstraint(Constraint):
     UniqueValueRatio = (values appearing exactly once) / COUNT(DISTINCT values)
     """
 
-    def __init__(self, columns: list[str], assertion: Assertion, *, hint: str = "") -> None:
-        self._columns = list(columns)
+    __slots__ = ("_assertion", "_cols_sql", "_columns", "_hint", "_label", "_name")
+
+    def __init__(self, columns: Iterable[str], assertion: Assertion, *, hint: str = "") -> None:
+        self._columns = tuple(columns)
         self._assertion = assertion
         self._hint = hint
+        self._cols_sql = ", ".join(f'"{c}"' for c in self._columns)
+        self._label = ", ".join(self._columns)
+        self._name = f"UniqueValueRatio({self._label})"
 
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
-        cols = ", ".join(f'"{c}"' for c in self._columns)
+        # The group keys are only needed for grouping, so the subquery projects just the counts.
         sql = (
-            f"SELECT CAST(SUM(CASE WHEN cnt = 1 THEN 1 ELSE 0 END) AS DOUBLE) "
+            f"SELECT CAST(COUNT(*) FILTER (WHERE cnt = 1) AS DOUBLE) "
             f"/ CAST(GREATEST(COUNT(*), 1) AS DOUBLE) AS uvr "
-            f"FROM (SELECT {cols}, COUNT(*) AS cnt FROM {table_name} GROUP BY {cols})"
+            f"FROM (SELECT COUNT(*) AS cnt FROM {table_name} GROUP BY {self._cols_sql})"
         )
         self.logger.debug("Executing SQL: %s", sql)
-        rows = ctx.sql(sql).collect()
-        value: float = rows[0].column("uvr")[0].as_py()
+        value: float = await query_scalar(ctx, sql)
         self.logger.debug("Metric value: %s", value)
         passed = self._assertion.evaluate(value)
-        col_label = ", ".join(self._columns)
         result = ConstraintResult(
             status=ConstraintStatus.SUCCESS if passed else ConstraintStatus.FAILURE,
             metric=value,
             message=""
             if passed
             else (
-                f"UniqueValueRatio of ({col_label}) is {value:.4f}, "
+                f"UniqueValueRatio of ({self._label}) is {value:.4f}, "
                 f"expected {self._assertion}. {self._hint}".strip()
             ),
             constraint_name=self.name(),
@@ -59,7 +65,7 @@ class UniqueValueRatioConstraint(Constraint):
         return result
 
     def name(self) -> str:
-        return f"UniqueValueRatio({', '.join(self._columns)})"
+        return self._name
 
     def metadata(self) -> ConstraintMetadata:
         return ConstraintMetadata(
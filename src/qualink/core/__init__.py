@@ -1,4 +1,10 @@
-from qualink.core.constraint import Constraint, ConstraintMetadata, ConstraintResult, ConstraintStatus
+from qualink.core.constraint import (
+    Constraint,
+    ConstraintMetadata,
+    ConstraintResult,
+    ConstraintStatus,
+    FusableConstraint,
+)
 from qualink.core.level import Level
 from qualink.core.logging_mixin import LoggingMixin, configure_logging, get_logger
 from qualink.core.result import (
@@ -16,6 +22,7 @@ __all__ = [
     "ConstraintMetadata",
     "ConstraintResult",
     "ConstraintStatus",
+    "FusableConstraint",
     "Level",
     "LoggingMixin",
     "ValidationIssue",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -11,6 +12,27 @@ if TYPE_CHECKING:
     from datafusion import SessionContext
 
 
+def collect_batches(ctx: SessionContext, sql: str) -> list[Any]:
+    """Plan and execute *sql*, returning its record batches."""
+    return ctx.sql(sql).collect()
+
+
+async def query_scalar(ctx: SessionContext, sql: str) -> Any:
+    """Run single-column *sql* and return its first value as a Python object.
+
+    The query runs in a worker thread. DataFusion releases the GIL while it
+    executes, so concurrently awaited queries overlap instead of blocking the loop.
+    """
+    batches = await asyncio.to_thread(collect_batches, ctx, sql)
+    return batches[0].column(0)[0].as_py()
+
+
+async def query_row(ctx: SessionContext, sql: str) -> dict[str, Any]:
+    """Run *sql* in a worker thread and return its first row keyed by column name."""
+    batches = await asyncio.to_thread(collect_batches, ctx, sql)
+    return batches[0].to_pylist()[0]
+
+
 class ConstraintStatus(Enum):
     """Outcome of evaluating a single constraint."""
 
@@ -22,7 +44,7 @@ class ConstraintStatus(Enum):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstraintMetadata:
     """Descriptive metadata attached to a constraint."""
 
@@ -49,6 +71,8 @@ class ConstraintResult:
 class Constraint(LoggingMixin, ABC):
     """Abstract base class that every validation constraint must implement."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def evaluate(self, ctx: SessionContext, table_name: str) -> ConstraintResult:
         """Evaluate this constraint against *table_name* registered in *ctx*."""
@@ -63,3 +87,23 @@ class Constraint(LoggingMixin, ABC):
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.name()!r})"
+
+
+class FusableConstraint(Constraint):
+    """A constraint whose metric is a single scalar aggregate over the table.
+
+    Checks fuse the :meth:`sql_fragment` of every such constraint into one
+    ``SELECT ... FROM table`` and hand each computed value back through
+    :meth:`evaluate_from_row`.  Both hooks are abstract, so a subclass that
+    implements only one of them cannot be instantiated.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def sql_fragment(self) -> str:
+        """Scalar aggregate expression computing this constraint's metric."""
+
+    @abstractmethod
+    def evaluate_from_row(self, value: Any) -> ConstraintResult:
+        """Build the result from the value computed by :meth:`sql_fragment`."""
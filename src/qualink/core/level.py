@@ -21,10 +21,14 @@ class Level(IntEnum):
     ERROR = 2
 
     def as_str(self) -> str:
-        return self.name.lower()
+        return _LEVEL_NAMES[self]
 
     def is_at_least(self, other: Level) -> bool:
         return self.value >= other.value
 
     def __str__(self) -> str:
-        return self.as_str()
+        return _LEVEL_NAMES[self]
+
+
+# Lower-case names computed once; formatters render a level for every issue.
+_LEVEL_NAMES: dict[Level, str] = {level: level.name.lower() for level in Level}
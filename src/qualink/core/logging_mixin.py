@@ -21,16 +21,25 @@ def configure_logging(
     root.setLevel(level)
 
 
+@functools.cache
+def _class_logger(cls: type) -> logging.Logger:
+    return logging.getLogger(f"{cls.__module__}.{cls.__qualname__}")
+
+
 class LoggingMixin:
-    """Mixin that provides a per-class ``self.logger`` cached property.
+    """Mixin that provides a per-class ``self.logger`` property.
+
+    The logger is cached per class rather than per instance, so subclasses may
+    declare ``__slots__``.
 
     logging.getLogger("qualink.constraints").setLevel(logging.DEBUG)
     """
 
-    @functools.cached_property
+    __slots__ = ()
+
+    @property
     def logger(self) -> logging.Logger:
-        cls = type(self)
-        return logging.getLogger(f"{cls.__module__}.{cls.__qualname__}")
+        return _class_logger(type(self))
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -42,6 +42,7 @@ class ValidationMetrics:
     error_count: int = 0
     warning_count: int = 0
     execution_time_ms: int = 0
+    total_rows: int | None = None
     custom_metrics: dict[str, float] = field(default_factory=dict)
 
     @property
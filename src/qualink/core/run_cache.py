@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from qualink.core.constraint import query_row
+from qualink.core.logging_mixin import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import pyarrow as pa
+    from datafusion import SessionContext
+
+# Fragment computed by ``SizeConstraint``; seeding it lets size checks skip their scan.
+ROW_COUNT_SQL = "CAST(COUNT(*) AS DOUBLE)"
+
+# Cache key for table schemas; not valid SQL, so it cannot collide with a fragment.
+_SCHEMA_KEY = "<schema>"
+
+_logger = get_logger("core.run_cache")
+
+_active: ContextVar[dict[tuple[str, str], Any] | None] = ContextVar("qualink_run_cache", default=None)
+
+
+@contextmanager
+def run_cache() -> Iterator[None]:
+    """Share scalar aggregate results between the checks of a single run.
+
+    Values are keyed by ``(table_name, sql_fragment)`` and discarded when the
+    outermost scope exits, so data changing between runs is never masked.
+    Nested scopes reuse the enclosing cache.
+    """
+    if _active.get() is not None:
+        yield
+        return
+    token = _active.set({})
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def cached_value(table_name: str, fragment: str) -> Any | None:
+    """Return the cached value of *fragment* over *table_name*, or ``None``."""
+    cache = _active.get()
+    if cache is None:
+        return None
+    return cache.get((table_name, fragment))
+
+
+def store_value(table_name: str, fragment: str, value: Any) -> None:
+    """Remember *value* for the current run; a no-op outside :func:`run_cache`."""
+    cache = _active.get()
+    if cache is not None and value is not None:
+        cache[(table_name, fragment)] = value
+
+
+def seed_row_count(table_name: str, count: int) -> None:
+    """Record a row count that is already known for *table_name*."""
+    store_value(table_name, ROW_COUNT_SQL, float(count))
+
+
+def table_schema(ctx: SessionContext, table_name: str) -> pa.Schema:
+    """Return the Arrow schema of *table_name*, resolved once per :func:`run_cache` scope.
+
+    The schema comes from the registered table provider, so no query is planned.
+    """
+    cache = _active.get()
+    key = (table_name, _SCHEMA_KEY)
+    if cache is not None and key in cache:
+        return cache[key]
+    schema = ctx.table(table_name).schema()
+    if cache is not None:
+        cache[key] = schema
+    return schema
+
+
+async def prefetch(ctx: SessionContext, table_name: str, fragments: Iterable[str]) -> None:
+    """Compute every uncached fragment over *table_name* in one ``SELECT`` and cache the values.
+
+    A no-op outside :func:`run_cache`. If the combined query fails, nothing is cached
+    and each constraint computes its own value later.
+    """
+    cache = _active.get()
+    if cache is None:
+        return
+    pending = list(dict.fromkeys(f for f in fragments if (table_name, f) not in cache))
+    if not pending:
+        return
+    projections = ", ".join(f"{fragment} AS c{i}" for i, fragment in enumerate(pending))
+    sql = f"SELECT {projections} FROM {table_name}"
+    _logger.debug("Prefetching %d aggregate(s) on '%s': %s", len(pending), table_name, sql)
+    try:
+        row = await query_row(ctx, sql)
+    except Exception:
+        _logger.warning(
+            "Prefetch query on '%s' failed; checks will query individually", table_name, exc_info=True
+        )
+        return
+    for i, fragment in enumerate(pending):
+        store_value(table_name, fragment, row[f"c{i}"])
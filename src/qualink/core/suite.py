@@ -4,7 +4,7 @@ import asyncio
 import time
 from typing import TYPE_CHECKING
 
-from qualink.core.constraint import Constraint, ConstraintStatus
+from qualink.core.constraint import Constraint, ConstraintStatus, FusableConstraint
 from qualink.core.level import Level
 from qualink.core.logging_mixin import LoggingMixin
 from qualink.core.result import (
@@ -14,6 +14,7 @@ from qualink.core.result import (
     ValidationReport,
     ValidationResult,
 )
+from qualink.core.run_cache import ROW_COUNT_SQL, cached_value, prefetch, run_cache, seed_row_count
 
 if TYPE_CHECKING:
     from datafusion import SessionContext
@@ -33,6 +34,7 @@ class ValidationSuite(LoggingMixin):
         table_name: str = "data",
         checks: list[Check] | None = None,
         run_parallel: bool = False,
+        max_parallel: int | None = None,
     ) -> None:
         self._name = name
         self._description = description
@@ -40,6 +42,7 @@ class ValidationSuite(LoggingMixin):
         self._table_name = table_name
         self._checks = list(checks or [])
         self._run_parallel = run_parallel
+        self._max_parallel = max_parallel
 
     @staticmethod
     def builder(name: str) -> ValidationSuiteBuilder:
@@ -63,6 +66,8 @@ class ValidationSuite(LoggingMixin):
             builder.description(self._description)
         builder.add_checks(list(self._checks))
         builder.run_parallel(self._run_parallel)
+        if self._max_parallel is not None:
+            builder.max_parallel(self._max_parallel)
         if self._ctx is not None:
             builder.on_data(self._ctx, self._table_name)
         else:
@@ -80,6 +85,8 @@ class ValidationSuiteBuilder(LoggingMixin):
         self._table_name: str = "data"
         self._checks: list[Check] = []
         self._run_parallel: bool = False
+        self._max_parallel: int | None = None
+        self._row_count_cache: int | None = None
         self.logger.debug("ValidationSuiteBuilder created: name='%s'", name)
 
     def description(self, desc: str) -> ValidationSuiteBuilder:
@@ -118,6 +125,20 @@ class ValidationSuiteBuilder(LoggingMixin):
         )
         return self
 
+    def max_parallel(self, limit: int) -> ValidationSuiteBuilder:
+        """Cap how many checks run at once when parallel execution is enabled."""
+        if limit < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {limit}")
+        self._max_parallel = limit
+        self.logger.debug("At most %d concurrent check(s) for suite '%s'", limit, self._name)
+        return self
+
+    def with_row_count(self, count: int) -> ValidationSuiteBuilder:
+        """Supply an already-known row count so size checks need not rescan the table."""
+        self._row_count_cache = count
+        self.logger.debug("Row count %d supplied for table '%s'", count, self._table_name)
+        return self
+
     async def run(self) -> ValidationResult:
         """Execute all checks against the DataFusion context."""
 
@@ -126,49 +147,61 @@ class ValidationSuiteBuilder(LoggingMixin):
             raise RuntimeError("No data context set. Call .on_data(ctx, table) before .run().")
 
         start_time = time.perf_counter()
+        # Snapshot the checks so results stay aligned even if the builder is modified mid-run.
+        checks = tuple(self._checks)
 
         self.logger.info(
             "Suite '%s' started — running %d check(s) on table '%s'",
             self._name,
-            len(self._checks),
+            len(checks),
             self._table_name,
         )
 
-        metrics = ValidationMetrics(total_checks=len(self._checks))
+        metrics = ValidationMetrics(total_checks=len(checks))
         issues: list[ValidationIssue] = []
-        check_results_map: dict[str, list] = {}
         overall_success = True
         worst_status = CheckStatus.SUCCESS
 
-        check_results: list[CheckResult] = []
-        if self._run_parallel:
-            check_results = await asyncio.gather(
-                *(check.run(self._ctx, self._table_name) for check in self._checks)
+        check_results: list[CheckResult]
+        with run_cache():
+            if self._row_count_cache is not None:
+                seed_row_count(self._table_name, self._row_count_cache)
+            # One scan computes the scalar aggregates of every check; each check then reads them back.
+            await prefetch(
+                self._ctx,
+                self._table_name,
+                (
+                    c.sql_fragment()
+                    for check in checks
+                    for c in check.constraints
+                    if isinstance(c, FusableConstraint)
+                ),
             )
-        else:
-            for check in self._checks:
-                check_results.append(await check.run(self._ctx, self._table_name))
+            if self._run_parallel:
+                limit = asyncio.Semaphore(self._max_parallel) if self._max_parallel else None
+                check_results = await asyncio.gather(*(self._run_check(check, limit) for check in checks))
+            else:
+                check_results = [await check.run(self._ctx, self._table_name) for check in checks]
+            row_count = cached_value(self._table_name, ROW_COUNT_SQL)
+            if row_count is not None:
+                metrics.total_rows = int(row_count)
 
-        for check, cr in zip(self._checks, check_results, strict=False):
+        check_results_map: dict[str, list] = {}
+        for check, cr in zip(checks, check_results, strict=False):
             check_results_map[check.name] = cr.constraint_results
             metrics.total_constraints += len(cr.constraint_results)
 
-            # Build a name→constraint lookup so we can grab metadata
-            constraint_by_name: dict[str, Constraint] = {c.name(): c for c in check.constraints}
+            # Name→constraint lookup for issue metadata; only built once the check has a failure.
+            constraint_by_name: dict[str, Constraint] | None = None
+            failed = 0
 
             for result in cr.constraint_results:
                 if result.status == ConstraintStatus.SUCCESS:
                     metrics.passed += 1
                 elif result.status == ConstraintStatus.FAILURE:
-                    metrics.failed += 1
-                    if check.level == Level.ERROR:
-                        metrics.error_count += 1
-                        overall_success = False
-                        worst_status = CheckStatus.ERROR
-                    elif check.level == Level.WARNING:
-                        metrics.warning_count += 1
-                        if worst_status != CheckStatus.ERROR:
-                            worst_status = CheckStatus.WARNING
+                    failed += 1
+                    if constraint_by_name is None:
+                        constraint_by_name = {c.name(): c for c in check.constraints}
 
                     # Resolve metadata for this constraint
                     meta = None
@@ -191,6 +224,18 @@ class ValidationSuiteBuilder(LoggingMixin):
                 else:
                     metrics.skipped += 1
 
+            # The level is fixed per check, so it is applied once to all of its failures.
+            if failed:
+                metrics.failed += failed
+                if check.level == Level.ERROR:
+                    metrics.error_count += failed
+                    overall_success = False
+                    worst_status = CheckStatus.ERROR
+                elif check.level == Level.WARNING:
+                    metrics.warning_count += failed
+                    if worst_status != CheckStatus.ERROR:
+                        worst_status = CheckStatus.WARNING
+
         elapsed_ms = int((time.perf_counter() - start_time) * 1000)
         metrics.execution_time_ms = elapsed_ms
 
@@ -232,6 +277,12 @@ class ValidationSuiteBuilder(LoggingMixin):
 
         return result
 
+    async def _run_check(self, check: Check, limit: asyncio.Semaphore | None) -> CheckResult:
+        if limit is None:
+            return await check.run(self._ctx, self._table_name)
+        async with limit:
+            return await check.run(self._ctx, self._table_name)
+
     def build(self) -> ValidationSuite:
         """Return a configured ``ValidationSuite`` (for deferred execution)."""
         return ValidationSuite(
@@ -241,4 +292,5 @@ class ValidationSuiteBuilder(LoggingMixin):
             table_name=self._table_name,
             checks=list(self._checks),
             run_parallel=self._run_parallel,
+            max_parallel=self._max_parallel,
         )
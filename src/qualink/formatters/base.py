@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 from qualink.core.logging_mixin import LoggingMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from qualink.core.result import ValidationResult
 
 
@@ -24,3 +26,12 @@ class ResultFormatter(LoggingMixin, ABC):
 
     @abstractmethod
     def format(self, result: ValidationResult) -> str: ...
+
+    def iter_format(self, result: ValidationResult) -> Iterator[str]:
+        """Return the formatted report as chunks, for writing without one large string.
+
+        The default formats eagerly and returns :meth:`format` as a single chunk, so a
+        formatting error surfaces before any output is opened; formatters that can
+        encode incrementally override it.
+        """
+        return iter((self.format(result),))
@@ -1,20 +1,93 @@
 from __future__ import annotations
 
 import json
+import math
 from typing import TYPE_CHECKING, Any
 
 from qualink.core.constraint import ConstraintStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
     from qualink.core.constraint import ConstraintResult
     from qualink.core.result import ValidationResult
 
 from qualink.formatters.base import ResultFormatter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Characters per chunk from ``iter_format``; large enough that writers see a few big writes.
+_CHUNK_SIZE = 64 * 1024
+
+
+def _finite(value: Any) -> Any:
+    """Map NaN and infinities to ``None``.
+
+    orjson encodes them as ``null`` while the standard library writes non-standard
+    ``NaN``/``Infinity`` tokens; normalising first keeps both encoders in agreement.
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    """Encode *payload* as indented JSON, using the orjson C encoder when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(payload, indent=2)
+
+
+def _iter_dumps(payload: dict[str, Any]) -> Iterator[str]:
+    """Yield exactly the text of :func:`_dumps` in pieces of about ``_CHUNK_SIZE`` characters.
+
+    With orjson the encoded document is sliced; otherwise the standard library's
+    per-token output is coalesced, so the full text is never held at once.
+    """
+    if orjson is not None:
+        text = _dumps(payload)
+        for start in range(0, len(text), _CHUNK_SIZE):
+            yield text[start : start + _CHUNK_SIZE]
+        return
+    buffer: list[str] = []
+    size = 0
+    for token in json.JSONEncoder(indent=2).iterencode(payload):
+        buffer.append(token)
+        size += len(token)
+        if size >= _CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
 
 class JsonFormatter(ResultFormatter):
     def format(self, result: ValidationResult) -> str:
         self.logger.debug("Formatting result as JSON for suite '%s'", result.report.suite_name)
+        output = _dumps(self._build_payload(result))
+        self.logger.debug("JSON format output: %d chars", len(output))
+        return output
+
+    def iter_format(self, result: ValidationResult) -> Iterator[str]:
+        """Encode the same document as :meth:`format` in chunks of about 64 KiB.
+
+        Uses the same encoder as :meth:`format`, so the joined chunks are always
+        identical to its output.
+        """
+        self.logger.debug("Streaming result as JSON for suite '%s'", result.report.suite_name)
+        return _iter_dumps(self._build_payload(result))
+
+    def stream(self, result: ValidationResult, fp: TextIO) -> None:
+        """Write the chunks of :meth:`iter_format` to *fp*, followed by a newline."""
+        fp.writelines(self.iter_format(result))
+        fp.write("\n")
+
+    def _build_payload(self, result: ValidationResult) -> dict[str, Any]:
         m = result.report.metrics
         payload: dict[str, Any] = {
             "suite": result.report.suite_name,
@@ -25,7 +98,7 @@ class JsonFormatter(ResultFormatter):
                 "passed": m.passed,
                 "failed": m.failed,
                 "skipped": m.skipped,
-                "pass_rate": round(m.pass_rate, 4),
+                "pass_rate": _finite(round(m.pass_rate, 4)),
                 "execution_time_ms": m.execution_time_ms,
             },
         }
@@ -34,21 +107,23 @@ class JsonFormatter(ResultFormatter):
                 {
                     "check": i.check_name,
                     "constraint": i.constraint_name,
-                    "level": str(i.level),
+                    "level": i.level.as_str(),
                     "message": i.message,
-                    "metric": i.metric,
+                    "metric": _finite(i.metric),
                     "column": i.column,
                     "description": i.description,
-                    **({"extra": i.metadata_extra} if i.metadata_extra else {}),
+                    **(
+                        {"extra": {k: _finite(v) for k, v in i.metadata_extra.items()}}
+                        if i.metadata_extra
+                        else {}
+                    ),
                 }
                 for i in result.report.issues
             ]
         check_results = self._serialize_check_results(result.report.check_results)
         if check_results:
             payload["check_results"] = check_results
-        output = json.dumps(payload, indent=2)
-        self.logger.debug("JSON format output: %d chars", len(output))
-        return output
+        return payload
 
     def _serialize_check_results(
         self,
@@ -61,7 +136,7 @@ class JsonFormatter(ResultFormatter):
                     "constraint": constraint_result.constraint_name,
                     "status": str(constraint_result.status),
                     "message": constraint_result.message,
-                    "metric": constraint_result.metric,
+                    "metric": _finite(constraint_result.metric),
                 }
                 for constraint_result in results
                 if self._should_include_constraint(constraint_result)
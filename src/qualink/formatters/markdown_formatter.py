@@ -10,6 +10,12 @@ if TYPE_CHECKING:
 from qualink.core.constraint import ConstraintStatus
 from qualink.formatters.base import ResultFormatter
 
+_STATUS_LABELS: dict[ConstraintStatus, str] = {
+    ConstraintStatus.SUCCESS: "PASS",
+    ConstraintStatus.FAILURE: "FAIL",
+    ConstraintStatus.SKIPPED: "SKIP",
+}
+
 
 class MarkdownFormatter(ResultFormatter):
     def format(self, result: ValidationResult) -> str:
@@ -38,16 +44,16 @@ class MarkdownFormatter(ResultFormatter):
 
         lines.extend(["", "## Constraint Results", ""])
 
-        constraint_rows: list[list[str]] = []
-        for check_name, results in result.report.check_results.items():
-            for cr in results:
-                icon = {
-                    ConstraintStatus.SUCCESS: "PASS",
-                    ConstraintStatus.FAILURE: "FAIL",
-                    ConstraintStatus.SKIPPED: "SKIP",
-                }.get(cr.status, "?")
-                metric_str = f"{cr.metric:.4f}" if cr.metric is not None else "-"
-                constraint_rows.append([check_name, cr.constraint_name, icon, metric_str])
+        constraint_rows = [
+            [
+                check_name,
+                cr.constraint_name,
+                _STATUS_LABELS.get(cr.status, "?"),
+                f"{cr.metric:.4f}" if cr.metric is not None else "-",
+            ]
+            for check_name, results in result.report.check_results.items()
+            for cr in results
+        ]
 
         lines.append(
             tabulate(
@@ -69,7 +75,7 @@ class MarkdownFormatter(ResultFormatter):
                 )
                 issue_rows.append(
                     [
-                        f"**{issue.level}**",
+                        f"**{issue.level.as_str()}**",
                         issue.check_name,
                         issue.constraint_name,
                         col_part,
@@ -1,11 +1,12 @@
 from qualink.output.service import OutputService
 from qualink.output.specs import OutputSpec, normalize_output_specs
-from qualink.output.writer import ResultWriter, write_text_output
+from qualink.output.writer import ResultWriter, write_chunks_output, write_text_output
 
 __all__ = [
     "OutputService",
     "OutputSpec",
     "ResultWriter",
     "normalize_output_specs",
+    "write_chunks_output",
     "write_text_output",
 ]
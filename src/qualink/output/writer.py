@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import pyarrow.fs as pafs
 
 from qualink.core.logging_mixin import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 _logger = get_logger("output.writer")
 
 
@@ -24,6 +28,13 @@ class ResultSink(ABC):
     def write_text(self, destination: str | Path, content: str) -> None:
         """Write text content to the destination."""
 
+    def write_chunks(self, destination: str | Path, chunks: Iterable[str]) -> None:
+        """Write text produced in chunks to the destination.
+
+        Sinks that can write incrementally override this; the default joins the chunks.
+        """
+        self.write_text(destination, "".join(chunks))
+
 
 class LocalFileResultSink(ResultSink):
     def kind(self) -> str:
@@ -35,12 +46,19 @@ class LocalFileResultSink(ResultSink):
         return "://" not in destination
 
     def write_text(self, destination: str | Path, content: str) -> None:
+        self.write_chunks(destination, (content,))
+
+    def write_chunks(self, destination: str | Path, chunks: Iterable[str]) -> None:
         path = destination if isinstance(destination, Path) else Path(destination)
         _logger.info("Writing validation output to local path: %s", path)
         _logger.debug("Ensuring local output directory exists: %s", path.parent)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
-        _logger.debug("Wrote %d characters to local output path: %s", len(content), path)
+        written = 0
+        with path.open("w", encoding="utf-8") as fp:
+            for chunk in chunks:
+                fp.write(chunk)
+                written += len(chunk)
+        _logger.debug("Wrote %d characters to local output path: %s", written, path)
 
 
 class PyArrowFileSystemResultSink(ResultSink):
@@ -56,6 +74,9 @@ class PyArrowFileSystemResultSink(ResultSink):
         return scheme in self._SUPPORTED_SCHEMES
 
     def write_text(self, destination: str | Path, content: str) -> None:
+        self.write_chunks(destination, (content,))
+
+    def write_chunks(self, destination: str | Path, chunks: Iterable[str]) -> None:
         if not isinstance(destination, str):
             raise TypeError("Remote filesystem destinations must be string URIs.")
 
@@ -66,9 +87,12 @@ class PyArrowFileSystemResultSink(ResultSink):
         if directory not in {"", "."}:
             _logger.debug("Ensuring remote output directory exists: %s", directory)
             filesystem.create_dir(directory, recursive=True)
+        written = 0
         with filesystem.open_output_stream(path) as output_stream:
-            output_stream.write(content.encode("utf-8"))
-        _logger.debug("Wrote %d characters to filesystem URI: %s", len(content), destination)
+            for chunk in chunks:
+                output_stream.write(chunk.encode("utf-8"))
+                written += len(chunk)
+        _logger.debug("Wrote %d characters to filesystem URI: %s", written, destination)
 
 
 class ResultWriter:
@@ -76,6 +100,12 @@ class ResultWriter:
         self._sinks = sinks or [LocalFileResultSink(), PyArrowFileSystemResultSink()]
 
     def write_text(self, destination: str | Path, content: str) -> None:
+        self._sink_for(destination).write_text(destination, content)
+
+    def write_chunks(self, destination: str | Path, chunks: Iterable[str]) -> None:
+        self._sink_for(destination).write_chunks(destination, chunks)
+
+    def _sink_for(self, destination: str | Path) -> ResultSink:
         for sink in self._sinks:
             if sink.supports(destination):
                 _logger.debug(
@@ -83,8 +113,7 @@ class ResultWriter:
                     type(sink).__name__,
                     destination,
                 )
-                sink.write_text(destination, content)
-                return
+                return sink
         _logger.error("No result sink supports destination: %r", destination)
         raise ValueError(f"Unsupported output destination: {destination!r}")
 
@@ -93,6 +122,10 @@ def write_text_output(destination: str | Path, content: str) -> None:
     ResultWriter().write_text(destination, content)
 
 
+def write_chunks_output(destination: str | Path, chunks: Iterable[str]) -> None:
+    ResultWriter().write_chunks(destination, chunks)
+
+
 def _resolve_filesystem_from_uri(destination: str) -> tuple[pafs.FileSystem, str]:
     _logger.debug("Resolving filesystem from URI: %s", destination)
     return pafs.FileSystem.from_uri(destination)
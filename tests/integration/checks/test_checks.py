@@ -494,3 +494,62 @@ class TestChecksIntegration:
         assert result.status == CheckStatus.SUCCESS
         assert len(result.constraint_results) == 3
         assert all(r.status == ConstraintStatus.SUCCESS for r in result.constraint_results)
+
+    @pytest.mark.asyncio()
+    async def test_fused_results_match_individual_evaluation(self, df_ctx):
+        """Fusable constraints share one query but produce the same results as running them alone."""
+        from qualink.constraints.approx_count_distinct import ApproxCountDistinctConstraint
+        from qualink.constraints.completeness import CompletenessConstraint
+        from qualink.constraints.compliance import ComplianceConstraint
+        from qualink.constraints.format import FormatConstraint, FormatType
+        from qualink.constraints.max_length import MaxLengthConstraint
+        from qualink.constraints.min_length import MinLengthConstraint
+        from qualink.constraints.pattern_match import PatternMatchConstraint
+        from qualink.constraints.size import SizeConstraint
+        from qualink.constraints.statistics import StatisticalConstraint, StatisticType
+
+        constraints = [
+            CompletenessConstraint("email", Assertion.greater_than(0.5)),
+            StatisticalConstraint("age", StatisticType.MAX, Assertion.less_than(100.0)),
+            MinLengthConstraint("name", Assertion.greater_than(2.0)),
+            MaxLengthConstraint("name", Assertion.less_than(10.0)),
+            PatternMatchConstraint("email", r"@test\.com$", Assertion.equal_to(1.0)),
+            FormatConstraint("email", FormatType.EMAIL, threshold=0.9),
+            ApproxCountDistinctConstraint("name", Assertion.greater_than(1.0)),
+            ComplianceConstraint("adult", "age >= 18", Assertion.greater_than(0.5)),
+            SizeConstraint(Assertion.equal_to(5.0)),
+        ]
+        check = Check(_name="fused", _level=Level.ERROR, _description="", _constraints=constraints)
+
+        sql, fused = check._compile_fused_sql("users_nulls")
+        assert [c for c, _ in fused] == constraints
+        assert sql.count("FROM users_nulls") == 1
+
+        result = await check.run(df_ctx, "users_nulls")
+        expected = [await c.evaluate(df_ctx, "users_nulls") for c in constraints]
+        assert [r.metric for r in result.constraint_results] == [r.metric for r in expected]
+        assert [r.status for r in result.constraint_results] == [r.status for r in expected]
+
+    @pytest.mark.asyncio()
+    async def test_fused_query_deduplicates_identical_aggregates(self, df_ctx):
+        check = (
+            Check.builder("dedup")
+            .has_max("age", Assertion.less_than(100.0))
+            .has_max("age", Assertion.greater_than(200.0))
+            .is_complete("id")
+            .has_completeness("id", Assertion.equal_to(1.0))
+            .build()
+        )
+
+        sql, fused = check._compile_fused_sql("users")
+        assert sql.count(" AS c") == 2
+        assert [alias for _, alias in fused] == ["c0", "c0", "c1", "c1"]
+
+        result = await check.run(df_ctx, "users")
+        statuses = [r.status for r in result.constraint_results]
+        assert statuses == [
+            ConstraintStatus.SUCCESS,
+            ConstraintStatus.FAILURE,
+            ConstraintStatus.SUCCESS,
+            ConstraintStatus.SUCCESS,
+        ]
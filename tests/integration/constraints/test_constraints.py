@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import pyarrow as pa
 import pytest
+from datafusion import SessionContext
 from qualink.constraints.approx_count_distinct import ApproxCountDistinctConstraint
 from qualink.constraints.approx_quantile import ApproxQuantileConstraint
 from qualink.constraints.assertion import Assertion
@@ -152,6 +154,31 @@ class TestConstraintsIntegration:
         assert result.status == ConstraintStatus.FAILURE
         assert result.metric == pytest.approx(1 / 3, abs=0.01)
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("data", "columns"),
+        [
+            ({"k": [1, 1, 2, 3, None, None]}, ["k"]),
+            ({"k": [None, 4, 5]}, ["k"]),
+            ({"a": [1, 1, 2, 2], "b": ["x", "y", "x", "x"]}, ["a", "b"]),
+            ({"k": pa.array([], type=pa.int64())}, ["k"]),
+        ],
+    )
+    async def test_unique_value_ratio_matches_case_sum_sql(self, data, columns):
+        """The FILTER-based ratio equals the earlier SUM(CASE ...) formulation, NULL groups included."""
+        ctx = SessionContext()
+        ctx.from_pydict(data, name="uvr")
+        cols = ", ".join(f'"{c}"' for c in columns)
+        reference = ctx.sql(
+            "SELECT CAST(SUM(CASE WHEN cnt = 1 THEN 1 ELSE 0 END) AS DOUBLE) "
+            "/ CAST(GREATEST(COUNT(*), 1) AS DOUBLE) AS uvr "
+            f"FROM (SELECT {cols}, COUNT(*) AS cnt FROM uvr GROUP BY {cols})"
+        ).to_pylist()[0]["uvr"]
+
+        result = await UniqueValueRatioConstraint(columns, Assertion.greater_than(-1.0)).evaluate(ctx, "uvr")
+
+        assert result.metric == pytest.approx(reference or 0.0)
+
     @pytest.mark.asyncio()
     async def test_max_age(self, df_ctx):
         """Max age in 'users' is 35."""
@@ -237,6 +264,30 @@ class TestConstraintsIntegration:
         assert result.status == ConstraintStatus.SUCCESS
         assert result.metric == 1.0
 
+    @pytest.mark.asyncio()
+    async def test_literal_pattern_matches_regex_result(self, df_ctx):
+        """A metacharacter-free pattern takes the substring path with the same result."""
+        literal = PatternMatchConstraint("email", "@test", Assertion.equal_to(1.0))
+        regex = PatternMatchConstraint("email", "@tes[t]", Assertion.equal_to(1.0))
+        literal_result = await literal.evaluate(df_ctx, "users_nulls")
+        regex_result = await regex.evaluate(df_ctx, "users_nulls")
+        assert literal_result.metric == regex_result.metric
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("literal", "regex"),
+        [("^a", "^[a]"), ("com$", "co[m]$"), ("^alice@test.com$", "^alice@test[.]com$")],
+    )
+    async def test_anchored_literal_matches_regex_result(self, df_ctx, literal, regex):
+        """Anchored literals use starts_with/ends_with/equality with the same result."""
+        literal_result = await PatternMatchConstraint("email", literal, Assertion.equal_to(1.0)).evaluate(
+            df_ctx, "users_nulls"
+        )
+        regex_result = await PatternMatchConstraint("email", regex, Assertion.equal_to(1.0)).evaluate(
+            df_ctx, "users_nulls"
+        )
+        assert literal_result.metric == regex_result.metric
+
     @pytest.mark.asyncio()
     async def test_email_format_type(self, df_ctx):
         """Use built-in EMAIL format on 'users' table."""
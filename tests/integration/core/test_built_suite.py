@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 from qualink.checks.check import Check
+from qualink.constraints.assertion import Assertion
 from qualink.core import ValidationSuite
 from qualink.core.level import Level
 
@@ -22,3 +25,40 @@ async def test_built_suite_runs_with_real_data(df_ctx) -> None:
     assert result.success is True
     assert result.report.metrics.total_checks == 1
     assert result.report.metrics.passed == 2
+
+
+@pytest.mark.asyncio()
+async def test_total_rows_reported_from_size_check(df_ctx) -> None:
+    with_size = await (
+        ValidationSuite.builder("Sized")
+        .on_data(df_ctx, "users")
+        .add_check(Check.builder("Size").has_size(Assertion.greater_than(0)).build())
+        .run()
+    )
+    without_size = await (
+        ValidationSuite.builder("Unsized")
+        .on_data(df_ctx, "users")
+        .add_check(Check.builder("Complete").is_complete("id").build())
+        .run()
+    )
+
+    rows = df_ctx.sql("SELECT COUNT(*) AS n FROM users").collect()[0].column("n")[0].as_py()
+    assert with_size.report.metrics.total_rows == rows
+    assert without_size.report.metrics.total_rows is None
+
+
+@pytest.mark.asyncio()
+async def test_checks_share_one_aggregate_scan(df_ctx) -> None:
+    suite = (
+        ValidationSuite.builder("Prefetched")
+        .on_data(df_ctx, "users")
+        .add_check(Check.builder("Complete").is_complete("id").build())
+        .add_check(Check.builder("Sized").has_size(Assertion.greater_than(0)).build())
+        .build()
+    )
+
+    with patch("qualink.checks.check.query_row", autospec=True) as check_query:
+        result = await suite.run()
+
+    assert result.report.metrics.passed == 2
+    check_query.assert_not_called()
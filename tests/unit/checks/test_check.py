@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from datafusion import SessionContext
 from qualink.checks.check import Check, CheckBuilder, CheckResult
-from qualink.core.constraint import Constraint, ConstraintResult, ConstraintStatus
+from qualink.core.constraint import Constraint, ConstraintResult, ConstraintStatus, FusableConstraint
 from qualink.core.level import Level
 from qualink.core.result import CheckStatus
 
@@ -27,6 +28,11 @@ class TestCheck:
         assert check.description == "desc"
         assert check.constraints == constraints
 
+    def test_uses_slots(self):
+        check = Check(_name="test", _level=Level.ERROR, _description="")
+        assert not hasattr(check, "__dict__")
+        assert not hasattr(CheckResult(check=check, status=CheckStatus.SUCCESS), "__dict__")
+
     def test_builder_static_method(self):
         builder = Check.builder("test")
         assert isinstance(builder, CheckBuilder)
@@ -63,6 +69,53 @@ class TestCheck:
 
         assert result.status == CheckStatus.ERROR
 
+    @pytest.mark.asyncio()
+    async def test_run_evaluates_concurrently_and_preserves_order(self):
+        started: list[str] = []
+        release = asyncio.Event()
+
+        def make_constraint(name: str, delay: float) -> MagicMock:
+            async def evaluate(ctx, table_name):
+                started.append(name)
+                await release.wait()
+                await asyncio.sleep(delay)
+                return ConstraintResult(status=ConstraintStatus.SUCCESS)
+
+            constraint = MagicMock(spec=Constraint)
+            constraint.evaluate = evaluate
+            constraint.name = MagicMock(return_value=name)
+            return constraint
+
+        constraints = [make_constraint("slow", 0.02), make_constraint("fast", 0.0)]
+        check = Check(_name="test", _level=Level.ERROR, _description="", _constraints=constraints)
+
+        task = asyncio.create_task(check.run(MagicMock(spec=SessionContext), "table"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert started == ["slow", "fast"]
+        release.set()
+        result = await task
+
+        assert [r.constraint_name for r in result.constraint_results] == ["slow", "fast"]
+
+    @pytest.mark.asyncio()
+    async def test_run_falls_back_when_fused_query_fails(self):
+        mock_constraint = MagicMock(spec=FusableConstraint)
+        mock_constraint.sql_fragment.return_value = "COUNT(*)"
+        mock_constraint.evaluate = AsyncMock(
+            return_value=ConstraintResult(status=ConstraintStatus.SUCCESS, constraint_name="con1")
+        )
+        mock_ctx = MagicMock(spec=SessionContext)
+        mock_ctx.sql.side_effect = Exception("boom")
+
+        check = Check(_name="test", _level=Level.ERROR, _description="", _constraints=[mock_constraint])
+        result = await check.run(mock_ctx, "table")
+
+        mock_ctx.sql.assert_called_once_with("SELECT COUNT(*) AS c0 FROM table")
+        mock_constraint.evaluate_from_row.assert_not_called()
+        mock_constraint.evaluate.assert_awaited_once_with(mock_ctx, "table")
+        assert result.status == CheckStatus.SUCCESS
+
 
 class TestCheckBuilder:
     def test_creation(self):
@@ -100,6 +153,13 @@ class TestCheckBuilder:
         assert isinstance(check, Check)
         assert check.name == "test"
         assert check.level == Level.INFO
+        assert check.constraints == (mock_con,)
+
+    def test_build_snapshots_constraints(self):
+        builder = CheckBuilder("test").add_constraint(MagicMock(spec=Constraint))
+        check = builder.build()
+        builder.add_constraint(MagicMock(spec=Constraint))
+        assert len(check.constraints) == 1
 
     def test_has_completeness(self):
         from qualink.constraints.assertion import Assertion
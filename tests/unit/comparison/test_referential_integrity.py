@@ -30,70 +30,50 @@ class TestReferentialIntegrity:
         assert ri._parent_col == "parent_col"
 
     @pytest.mark.asyncio()
-    async def test_run_full_match(self):
-        # Mock ctx.sql to return total=10, unmatched=0
+    @pytest.mark.parametrize(
+        ("total", "unmatched", "expected_ratio"),
+        [
+            (10, 0, 1.0),
+            (10, 3, 0.7),
+            (0, 0, 0.0),
+        ],
+    )
+    async def test_run(self, total, unmatched, expected_ratio):
         mock_ctx = MagicMock(spec=SessionContext)
-        mock_result_total = MagicMock(spec=DataFrame)
-        mock_result_total.collect.return_value = [MagicMock()]
-        mock_result_total.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_total.collect.return_value[0].column.return_value[0].as_py.return_value = 10
-
-        mock_result_unmatched = MagicMock(spec=DataFrame)
-        mock_result_unmatched.collect.return_value = [MagicMock()]
-        mock_result_unmatched.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_unmatched.collect.return_value[0].column.return_value[0].as_py.return_value = 0
-
-        mock_ctx.sql.side_effect = [mock_result_total, mock_result_unmatched]
+        mock_result = MagicMock(spec=DataFrame)
+        mock_result.collect.return_value = [MagicMock()]
+        mock_result.collect.return_value[0].to_pylist.return_value = [
+            {"total": total, "unmatched": unmatched}
+        ]
+        mock_ctx.sql.return_value = mock_result
 
         ri = ReferentialIntegrity("child", "child_col", "parent", "parent_col")
         result = await ri.run(mock_ctx)
 
-        assert result.match_ratio == 1.0
-        assert result.unmatched_count == 0
-        assert result.total_count == 10
+        mock_ctx.sql.assert_called_once()
+        assert result.match_ratio == pytest.approx(expected_ratio)
+        assert result.unmatched_count == unmatched
+        assert result.total_count == total
 
     @pytest.mark.asyncio()
-    async def test_run_partial_match(self):
-        # total=10, unmatched=3
-        mock_ctx = MagicMock(spec=SessionContext)
-        mock_result_total = MagicMock(spec=DataFrame)
-        mock_result_total.collect.return_value = [MagicMock()]
-        mock_result_total.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_total.collect.return_value[0].column.return_value[0].as_py.return_value = 10
+    async def test_run_ignores_duplicate_parent_keys(self):
+        ctx = SessionContext()
+        ctx.from_pydict({"pid": [1, 2, 3, None, 5, 5]}, name="child")
+        ctx.from_pydict({"id": [1, 1, 2, 3]}, name="parent")
 
-        mock_result_unmatched = MagicMock(spec=DataFrame)
-        mock_result_unmatched.collect.return_value = [MagicMock()]
-        mock_result_unmatched.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_unmatched.collect.return_value[0].column.return_value[0].as_py.return_value = 3
-
-        mock_ctx.sql.side_effect = [mock_result_total, mock_result_unmatched]
-
-        ri = ReferentialIntegrity("child", "child_col", "parent", "parent_col")
-        result = await ri.run(mock_ctx)
+        result = await ReferentialIntegrity("child", "pid", "parent", "id").run(ctx)
 
-        assert result.match_ratio == 0.7  # (10-3)/10
-        assert result.unmatched_count == 3
-        assert result.total_count == 10
+        assert result.total_count == 5
+        assert result.unmatched_count == 2
+        assert result.match_ratio == pytest.approx(0.6)
 
     @pytest.mark.asyncio()
-    async def test_run_no_data(self):
-        # total=0
-        mock_ctx = MagicMock(spec=SessionContext)
-        mock_result_total = MagicMock(spec=DataFrame)
-        mock_result_total.collect.return_value = [MagicMock()]
-        mock_result_total.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_total.collect.return_value[0].column.return_value[0].as_py.return_value = 0
-
-        mock_result_unmatched = MagicMock(spec=DataFrame)
-        mock_result_unmatched.collect.return_value = [MagicMock()]
-        mock_result_unmatched.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_unmatched.collect.return_value[0].column.return_value[0].as_py.return_value = 0
+    async def test_run_quotes_column_names(self):
+        ctx = SessionContext()
+        ctx.from_pydict({'parent "id"': [1, 2]}, name="child")
+        ctx.from_pydict({"Id": [1]}, name="parent")
 
-        mock_ctx.sql.side_effect = [mock_result_total, mock_result_unmatched]
-
-        ri = ReferentialIntegrity("child", "child_col", "parent", "parent_col")
-        result = await ri.run(mock_ctx)
+        result = await ReferentialIntegrity("child", 'parent "id"', "parent", "Id").run(ctx)
 
-        assert result.match_ratio == 0.0
-        assert result.unmatched_count == 0
-        assert result.total_count == 0
+        assert result.total_count == 2
+        assert result.unmatched_count == 1
@@ -28,67 +28,27 @@ class TestRowCountMatch:
         assert rcm._table_b == "table_b"
 
     @pytest.mark.asyncio()
-    async def test_run_equal_counts(self):
+    @pytest.mark.parametrize(
+        ("count_a", "count_b", "expected_ratio"),
+        [
+            (100, 100, 1.0),
+            (10, 8, 0.8),  # min(10,8)/max(10,8)
+            (0, 0, 0.0),
+        ],
+    )
+    async def test_run(self, count_a, count_b, expected_ratio):
         mock_ctx = MagicMock(spec=SessionContext)
-        mock_result_a = MagicMock(spec=DataFrame)
-        mock_result_a.collect.return_value = [MagicMock()]
-        mock_result_a.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_a.collect.return_value[0].column.return_value[0].as_py.return_value = 100
-
-        mock_result_b = MagicMock(spec=DataFrame)
-        mock_result_b.collect.return_value = [MagicMock()]
-        mock_result_b.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_b.collect.return_value[0].column.return_value[0].as_py.return_value = 100
-
-        mock_ctx.sql.side_effect = [mock_result_a, mock_result_b]
-
-        rcm = RowCountMatch("table_a", "table_b")
-        result = await rcm.run(mock_ctx)
-
-        assert result.count_a == 100
-        assert result.count_b == 100
-        assert result.ratio == 1.0
-
-    @pytest.mark.asyncio()
-    async def test_run_different_counts(self):
-        mock_ctx = MagicMock(spec=SessionContext)
-        mock_result_a = MagicMock(spec=DataFrame)
-        mock_result_a.collect.return_value = [MagicMock()]
-        mock_result_a.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_a.collect.return_value[0].column.return_value[0].as_py.return_value = 10
-
-        mock_result_b = MagicMock(spec=DataFrame)
-        mock_result_b.collect.return_value = [MagicMock()]
-        mock_result_b.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_b.collect.return_value[0].column.return_value[0].as_py.return_value = 8
-
-        mock_ctx.sql.side_effect = [mock_result_a, mock_result_b]
-
-        rcm = RowCountMatch("table_a", "table_b")
-        result = await rcm.run(mock_ctx)
-
-        assert result.count_a == 10
-        assert result.count_b == 8
-        assert result.ratio == 0.8  # min(10,8)/max(10,8)
-
-    @pytest.mark.asyncio()
-    async def test_run_zero_counts(self):
-        mock_ctx = MagicMock(spec=SessionContext)
-        mock_result_a = MagicMock(spec=DataFrame)
-        mock_result_a.collect.return_value = [MagicMock()]
-        mock_result_a.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_a.collect.return_value[0].column.return_value[0].as_py.return_value = 0
-
-        mock_result_b = MagicMock(spec=DataFrame)
-        mock_result_b.collect.return_value = [MagicMock()]
-        mock_result_b.collect.return_value[0].column.return_value = [MagicMock()]
-        mock_result_b.collect.return_value[0].column.return_value[0].as_py.return_value = 0
-
-        mock_ctx.sql.side_effect = [mock_result_a, mock_result_b]
+        mock_result = MagicMock(spec=DataFrame)
+        mock_result.collect.return_value = [MagicMock()]
+        mock_result.collect.return_value[0].to_pylist.return_value = [
+            {"count_a": count_a, "count_b": count_b}
+        ]
+        mock_ctx.sql.return_value = mock_result
 
         rcm = RowCountMatch("table_a", "table_b")
         result = await rcm.run(mock_ctx)
 
-        assert result.count_a == 0
-        assert result.count_b == 0
-        assert result.ratio == 0.0
+        mock_ctx.sql.assert_called_once()
+        assert result.count_a == count_a
+        assert result.count_b == count_b
+        assert result.ratio == expected_ratio
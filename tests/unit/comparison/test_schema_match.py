@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from datafusion import DataFrame, SessionContext
 from qualink.comparison.schema_match import SchemaMatch, SchemaMatchResult
+from qualink.core.run_cache import run_cache
 
 
 class TestSchemaMatchResult:
@@ -60,8 +61,7 @@ class TestSchemaMatch:
         mock_field_a2.type = MagicMock()
         mock_field_a2.type.__str__ = MagicMock(return_value="Utf8")
 
-        mock_schema_a.field.side_effect = lambda i: [mock_field_a1, mock_field_a2][i]
-        mock_schema_a.__len__ = MagicMock(return_value=2)
+        mock_schema_a.__iter__.return_value = iter([mock_field_a1, mock_field_a2])
 
         # Same for table_b
         mock_schema_b = MagicMock()
@@ -75,15 +75,14 @@ class TestSchemaMatch:
         mock_field_b2.type = MagicMock()
         mock_field_b2.type.__str__ = MagicMock(return_value="Utf8")
 
-        mock_schema_b.field.side_effect = lambda i: [mock_field_b1, mock_field_b2][i]
-        mock_schema_b.__len__ = MagicMock(return_value=2)
+        mock_schema_b.__iter__.return_value = iter([mock_field_b1, mock_field_b2])
 
         mock_sql_a = MagicMock(spec=DataFrame)
         mock_sql_a.schema.return_value = mock_schema_a
         mock_sql_b = MagicMock(spec=DataFrame)
         mock_sql_b.schema.return_value = mock_schema_b
 
-        mock_ctx.sql.side_effect = [mock_sql_a, mock_sql_b]
+        mock_ctx.table.side_effect = [mock_sql_a, mock_sql_b]
 
         sm = SchemaMatch("table_a", "table_b")
         result = await sm.run(mock_ctx)
@@ -107,8 +106,7 @@ class TestSchemaMatch:
         mock_field_a2.name = "col2"
         mock_field_a2.type.__str__ = MagicMock(return_value="Utf8")
 
-        mock_schema_a.field.side_effect = lambda i: [mock_field_a1, mock_field_a2][i]
-        mock_schema_a.__len__ = MagicMock(return_value=2)
+        mock_schema_a.__iter__.return_value = iter([mock_field_a1, mock_field_a2])
 
         # table_b: col1 Int64, col3 Utf8, col4 Float64
         mock_schema_b = MagicMock()
@@ -124,15 +122,14 @@ class TestSchemaMatch:
         mock_field_b4.name = "col4"
         mock_field_b4.type.__str__ = MagicMock(return_value="Float64")
 
-        mock_schema_b.field.side_effect = lambda i: [mock_field_b1, mock_field_b3, mock_field_b4][i]
-        mock_schema_b.__len__ = MagicMock(return_value=3)
+        mock_schema_b.__iter__.return_value = iter([mock_field_b1, mock_field_b3, mock_field_b4])
 
         mock_sql_a = MagicMock(spec=DataFrame)
         mock_sql_a.schema.return_value = mock_schema_a
         mock_sql_b = MagicMock(spec=DataFrame)
         mock_sql_b.schema.return_value = mock_schema_b
 
-        mock_ctx.sql.side_effect = [mock_sql_a, mock_sql_b]
+        mock_ctx.table.side_effect = [mock_sql_a, mock_sql_b]
 
         sm = SchemaMatch("table_a", "table_b")
         result = await sm.run(mock_ctx)
@@ -141,3 +138,17 @@ class TestSchemaMatch:
         assert result.only_in_a == ["col2"]
         assert result.only_in_b == ["col3", "col4"]
         assert result.type_mismatches == {}
+
+    @pytest.mark.asyncio()
+    async def test_run_reuses_schemas_within_run_cache(self):
+        ctx = SessionContext()
+        ctx.from_pydict({"id": [1], "name": ["a"]}, name="table_a")
+        ctx.from_pydict({"id": [2]}, name="table_b")
+
+        with patch.object(ctx, "table", wraps=ctx.table) as table, run_cache():
+            first = await SchemaMatch("table_a", "table_b").run(ctx)
+            second = await SchemaMatch("table_b", "table_a").run(ctx)
+
+        assert table.call_count == 2
+        assert first.only_in_a == ["name"]
+        assert second.only_in_b == ["name"]
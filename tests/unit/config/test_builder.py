@@ -1,16 +1,35 @@
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from datafusion import SessionContext
 from qualink.checks.check import CheckBuilder
-from qualink.config.builder import _apply_rule, _build_check, build_suite_from_yaml, run_yaml
+from qualink.config.builder import (
+    _apply_rule,
+    _bound_to_assertion,
+    _build_check,
+    _build_checks,
+    _config_key,
+    build_suite_from_yaml,
+    clear_compiled_checks,
+    run_yaml,
+)
+from qualink.config.parser import parse_assertion
 from qualink.core.level import Level
 from qualink.core.result import ValidationResult
 from qualink.core.suite import ValidationSuiteBuilder
 
 
+@pytest.fixture(autouse=True)
+def _fresh_compiled_checks():
+    clear_compiled_checks()
+    yield
+    clear_compiled_checks()
+
+
 class TestBuildSuiteFromYaml:
-    @patch("qualink.config.builder.SessionContext")
+    @patch("datafusion.SessionContext")
     def test_build_suite_from_yaml(self, mock_ctx_class):
         mock_ctx = MagicMock(spec=SessionContext)
         mock_ctx_class.return_value = mock_ctx
@@ -37,7 +56,7 @@ checks:
             # Check that register_csv was called
             mock_ctx.register_csv.assert_called_with("source_0", "test.csv")
 
-    @patch("qualink.config.builder.SessionContext")
+    @patch("datafusion.SessionContext")
     def test_build_suite_from_yaml_with_named_object_store_connection(self, mock_ctx_class):
         mock_ctx = MagicMock(spec=SessionContext)
         mock_ctx_class.return_value = mock_ctx
@@ -70,6 +89,41 @@ checks:
             mock_ctx.register_object_store.assert_called_once()
             mock_ctx.register_parquet.assert_called_once_with("users", "s3://demo-bucket/users/data.parquet")
 
+    @patch("datafusion.SessionContext")
+    @patch("datafusion.SessionConfig")
+    def test_suite_session_options(self, mock_config_class, mock_ctx_class):
+        build_suite_from_yaml(
+            """
+suite:
+  name: Tuned Suite
+  target_partitions: 3
+  parquet_pruning: false
+checks: []
+"""
+        )
+        with_partitions = mock_config_class.return_value.with_target_partitions
+        with_partitions.assert_called_once_with(3)
+        with_partitions.return_value.with_parquet_pruning.assert_called_once_with(False)
+        mock_ctx_class.assert_called_once_with(with_partitions.return_value.with_parquet_pruning.return_value)
+
+    @patch("datafusion.SessionContext")
+    @patch("datafusion.SessionConfig")
+    def test_suite_parquet_pushdown_filters(self, mock_config_class, mock_ctx_class):
+        build_suite_from_yaml("suite:\n  parquet_pushdown_filters: true\nchecks: []\n")
+
+        mock_set = mock_config_class.return_value.set
+        mock_set.assert_called_once_with("datafusion.execution.parquet.pushdown_filters", "true")
+        mock_set.return_value.set.assert_called_once_with(
+            "datafusion.execution.parquet.reorder_filters", "true"
+        )
+        mock_ctx_class.assert_called_once_with(mock_set.return_value.set.return_value)
+
+    def test_suite_max_parallel(self):
+        builder = build_suite_from_yaml("suite:\n  run_parallel: true\n  max_parallel: 2\nchecks: []\n")
+
+        assert builder._run_parallel is True
+        assert builder._max_parallel == 2
+
 
 class TestRunYaml:
     @pytest.mark.asyncio()
@@ -100,6 +154,66 @@ class TestBuildCheck:
         assert check.description == "Test desc"
         assert len(check.constraints) == 1
 
+    @pytest.mark.parametrize(
+        ("raw_level", "expected"),
+        [("WARNING", Level.WARNING), ("Info", Level.INFO), ("eRrOr", Level.ERROR), (Level.INFO, Level.INFO)],
+    )
+    def test_build_check_level_spellings(self, raw_level, expected):
+        check = _build_check({"name": "c", "level": raw_level, "rules": []})
+        assert check.level == expected
+
+    def test_build_checks_reuses_compiled_checks(self):
+        cfgs = [{"name": "Reused", "rules": [{"is_complete": "id"}]}]
+
+        first = _build_checks(cfgs)
+        second = _build_checks([{"name": "Reused", "rules": [{"is_complete": "id"}]}])
+
+        assert second[0] is not first[0]
+        assert second[0].constraints is first[0].constraints
+
+    def test_build_checks_returns_independent_checks(self):
+        cfgs = [{"name": "Isolated", "rules": [{"is_complete": "id"}]}]
+        first = _build_checks(cfgs)
+        first[0]._constraints = ()
+
+        assert len(_build_checks(cfgs)[0].constraints) == 1
+
+    def test_build_checks_validation_does_not_depend_on_cache(self):
+        def cfgs(level):
+            return [{"name": "Leveled", "level": level, "rules": [{"is_complete": "id"}]}]
+
+        assert _build_checks(cfgs(Level.WARNING))[0].level == Level.WARNING
+        with pytest.raises(ValueError, match="Unknown check level: '1'"):
+            _build_checks(cfgs(1))
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ({1: "a"}, {"1": "a"}),
+            (1, True),
+            (1, 1.0),
+            (Level.WARNING, 1),
+        ],
+    )
+    def test_config_key_keeps_types(self, first, second):
+        assert _config_key(first) != _config_key(second)
+
+    def test_clear_compiled_checks(self):
+        cfgs = [{"name": "Cleared", "rules": [{"is_complete": "id"}]}]
+        first = _build_checks(cfgs)
+        clear_compiled_checks()
+
+        assert _build_checks(cfgs)[0].constraints is not first[0].constraints
+
+    def test_build_checks_rebuilds_non_json_config(self):
+        cfgs = [{"name": "Opaque", "description": object(), "rules": []}]
+
+        assert _build_checks(cfgs) is not _build_checks(cfgs)
+
+    def test_build_check_unknown_level(self):
+        with pytest.raises(ValueError, match="Unknown check level: 'fatal'"):
+            _build_check({"name": "c", "level": "FATAL", "rules": []})
+
 
 class TestApplyRule:
     """Tests for _apply_rule which now delegates directly to the constraint registry."""
@@ -209,3 +323,32 @@ class TestApplyRule:
         cb.add_constraint.assert_called_once()
         constraint = cb.add_constraint.call_args[0][0]
         assert isinstance(constraint, SchemaMatchConstraint)
+
+
+@pytest.mark.parametrize(
+    ("key", "value", "shorthand"),
+    [
+        ("gt", 1, "> 1"),
+        ("gte", 2.5, ">= 2.5"),
+        ("min", 0, ">= 0"),
+        ("lt", 3, "< 3"),
+        ("lte", 4, "<= 4"),
+        ("max", 5, "<= 5"),
+        ("eq", 1.0, "== 1.0"),
+        ("value", 7, "== 7"),
+        ("between", [0, 10], "between 0 10"),
+    ],
+)
+def test_bound_to_assertion_matches_shorthand(key, value, shorthand):
+    assert _bound_to_assertion(key, value) == parse_assertion(shorthand)
+
+
+def test_bound_to_assertion_unknown_key():
+    with pytest.raises(ValueError, match="Unknown bound key"):
+        _bound_to_assertion("near", 1)
+
+
+def test_import_config_does_not_load_datafusion():
+    code = "import sys, qualink.config; print('datafusion' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 class TestBuilderIntegration:
     """Test that the builder correctly handles URI-driven data sources."""
 
-    @patch("qualink.config.builder.SessionContext")
+    @patch("datafusion.SessionContext")
     def test_s3_data_source_in_yaml(self, mock_ctx_class):
         from qualink.config.builder import build_suite_from_yaml
 
@@ -30,7 +30,7 @@ class TestBuilderIntegration:
             mock_ctx.register_object_store.assert_called_once()
             mock_ctx.register_parquet.assert_called_once_with("users", "s3://my-bucket/data/users.parquet")
 
-    @patch("qualink.config.builder.SessionContext")
+    @patch("datafusion.SessionContext")
     def test_local_csv_still_works(self, mock_ctx_class):
         from qualink.config.builder import build_suite_from_yaml
 
@@ -47,7 +47,7 @@ class TestBuilderIntegration:
             assert builder is not None
             mock_ctx.register_csv.assert_called_with("users", "test.csv")
 
-    @patch("qualink.config.builder.SessionContext")
+    @patch("datafusion.SessionContext")
     def test_mixed_local_and_s3(self, mock_ctx_class):
         from qualink.config.builder import build_suite_from_yaml
 
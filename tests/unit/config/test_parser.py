@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
+from qualink.config import parser
 from qualink.config.parser import load_yaml, parse_assertion
 from qualink.constraints.assertion import Assertion
 
@@ -32,10 +34,17 @@ class TestParseAssertion:
         assertion = parse_assertion("between 1 10")
         assert isinstance(assertion, Assertion)
 
+    def test_parse_shorthand_reuses_instances(self):
+        assert parse_assertion(">= 0.95") is parse_assertion(">= 0.95")
+
     def test_parse_shorthand_invalid(self):
         with pytest.raises(ValueError, match="Invalid assertion shorthand"):
             parse_assertion("invalid")
 
+    def test_parse_shorthand_unknown_operator(self):
+        with pytest.raises(ValueError, match="Unknown operator in shorthand: '!='"):
+            parse_assertion("!= 5")
+
     def test_parse_dict_greater_than(self):
         assertion = parse_assertion({"operator": "greater_than", "value": 5})
         assert isinstance(assertion, Assertion)
@@ -87,6 +96,37 @@ suite:
 
         assert data["suite"]["name"] == "Test"
 
+    def test_load_yaml_rereads_modified_file(self, tmp_path):
+        yaml_file = tmp_path / "test.yaml"
+        yaml_file.write_text("suite:\n  name: First")
+        assert load_yaml(yaml_file)["suite"]["name"] == "First"
+
+        yaml_file.write_text("suite:\n  name: Second, longer")
+
+        assert load_yaml(yaml_file)["suite"]["name"] == "Second, longer"
+
+    def test_load_yaml_returns_independent_copies(self):
+        yaml_string = "suite:\n  name: Test Suite\n"
+
+        first = load_yaml(yaml_string)
+        first["suite"]["name"] = "mutated"
+
+        assert load_yaml(yaml_string)["suite"]["name"] == "Test Suite"
+
+    @pytest.mark.parametrize("text", ["suite: {name: Inline}", "{suite: {name: Inline}}"])
+    def test_load_yaml_inline_one_liner_skips_filesystem(self, text):
+        with patch("qualink.config.parser.Path.is_file") as mock_is_file:
+            data = load_yaml(text)
+
+        mock_is_file.assert_not_called()
+        assert data["suite"]["name"] == "Inline"
+
+    def test_uses_libyaml_loader_when_available(self):
+        if not yaml.__with_libyaml__:
+            pytest.skip("PyYAML built without libyaml")
+
+        assert parser._SafeLoader is yaml.CSafeLoader
+
     def test_load_yaml_from_file_uri(self, tmp_path):
         yaml_file = tmp_path / "test.yaml"
         yaml_file.write_text("suite:\n  name: File URI Test")
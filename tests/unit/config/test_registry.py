@@ -1,5 +1,15 @@
+from unittest.mock import patch
+
 import pytest
-from qualink.config.registry import available_types, build_constraint
+from qualink.config.registry import (
+    _CLASSES,
+    _INDEX,
+    _KIND_BUILDERS,
+    _STATS,
+    Kind,
+    available_types,
+    build_constraint,
+)
 
 
 class TestBuildConstraint:
@@ -67,6 +77,66 @@ class TestBuildConstraint:
         )
         assert constraint.__class__.__name__ == "SchemaMatchConstraint"
 
+    def test_build_reuses_resolved_class(self, monkeypatch):
+        defn = _INDEX["is_complete"]
+        monkeypatch.delitem(_CLASSES, defn.names[0], raising=False)
+        first = build_constraint("is_complete", {"column": "col", "assertion": "== 1.0"})
+        assert _CLASSES[defn.names[0]] is type(first)
+
+        with patch("qualink.config.registry._import", autospec=True) as mock_import:
+            second = build_constraint("is_complete", {"column": "col", "assertion": "== 1.0"})
+        mock_import.assert_not_called()
+        assert type(second) is type(first)
+
+    @pytest.mark.parametrize(("type_name", "stat"), [("min", "MIN"), ("has_stddev", "STDDEV")])
+    def test_build_stat_reuses_resolved_enum(self, monkeypatch, type_name, stat):
+        defn = _INDEX[type_name]
+        monkeypatch.delitem(_STATS, defn.names[0], raising=False)
+        params = {"column": "col", "assertion": "> 0"}
+        first = build_constraint(type_name, params)
+        assert _STATS[defn.names[0]] is first._stat_type
+        assert first._stat_type.name == stat
+
+        with patch("qualink.config.registry._import", autospec=True) as mock_import:
+            second = build_constraint(type_name, params)
+        mock_import.assert_not_called()
+        assert second._stat_type is first._stat_type
+
+    def test_every_kind_has_builder(self):
+        assert set(_KIND_BUILDERS) == set(Kind)
+
+    def test_build_type_name_is_case_insensitive(self):
+        constraint = build_constraint("Is_Complete", {"column": "col", "assertion": "== 1.0"})
+        assert constraint.__class__.__name__ == "CompletenessConstraint"
+
+    @pytest.mark.parametrize(
+        ("type_name", "params", "field"),
+        [
+            ("has_min", {"column": "col"}, "assertion"),
+            ("has_min", {"assertion": "> 0"}, "column"),
+            ("has_correlation", {"column_a": "a", "assertion": "> 0"}, "column_b"),
+        ],
+    )
+    def test_build_missing_field(self, type_name, params, field):
+        with pytest.raises(ValueError, match=f"missing required field '{field}'"):
+            build_constraint(type_name, params)
+
+    def test_build_unknown_format_type(self):
+        with pytest.raises(ValueError, match="Unknown format_type: 'bogus'"):
+            build_constraint("has_format", {"column": "a", "format_type": "bogus"})
+
+    def test_build_keeps_unrelated_key_errors(self, monkeypatch):
+        def broken_build(cls, defn, params):
+            raise KeyError("internal")
+
+        monkeypatch.setitem(_KIND_BUILDERS, Kind.CUSTOM, broken_build)
+        with pytest.raises(KeyError, match="internal"):
+            build_constraint("has_pattern", {"column": "a", "pattern": "x"})
+
+    def test_build_unknown_shorthand_operator(self):
+        with pytest.raises(ValueError, match="Unknown operator in shorthand: '!='"):
+            build_constraint("has_min", {"column": "col", "assertion": "!= 5"})
+
     def test_build_unknown_type(self):
         with pytest.raises(ValueError, match="Unknown constraint type"):
             build_constraint("unknown", {})
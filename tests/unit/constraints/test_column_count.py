@@ -34,7 +34,7 @@ class TestColumnCountConstraint:
         mock_df.schema.return_value = mock_schema
 
         mock_ctx = MagicMock(spec=SessionContext)
-        mock_ctx.sql.return_value = mock_df
+        mock_ctx.table.return_value = mock_df
 
         assertion = Assertion.equal_to(5.0)
         c = ColumnCountConstraint(assertion)
@@ -53,7 +53,7 @@ class TestColumnCountConstraint:
         mock_df.schema.return_value = mock_schema
 
         mock_ctx = MagicMock(spec=SessionContext)
-        mock_ctx.sql.return_value = mock_df
+        mock_ctx.table.return_value = mock_df
 
         assertion = Assertion.greater_than(4.0)
         c = ColumnCountConstraint(assertion)
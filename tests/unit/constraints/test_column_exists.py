@@ -36,7 +36,7 @@ class TestColumnExistsConstraint:
         mock_df.schema.return_value = mock_schema
 
         mock_ctx = MagicMock(spec=SessionContext)
-        mock_ctx.sql.return_value = mock_df
+        mock_ctx.table.return_value = mock_df
 
         c = ColumnExistsConstraint("col")
         result = await c.evaluate(mock_ctx, "table")
@@ -59,7 +59,7 @@ class TestColumnExistsConstraint:
         mock_df.schema.return_value = mock_schema
 
         mock_ctx = MagicMock(spec=SessionContext)
-        mock_ctx.sql.return_value = mock_df
+        mock_ctx.table.return_value = mock_df
 
         c = ColumnExistsConstraint("missing_col", hint="Add the column")
         result = await c.evaluate(mock_ctx, "table")
@@ -78,7 +78,7 @@ class TestColumnExistsConstraint:
         mock_df.schema.return_value = mock_schema
 
         mock_ctx = MagicMock(spec=SessionContext)
-        mock_ctx.sql.return_value = mock_df
+        mock_ctx.table.return_value = mock_df
 
         c = ColumnExistsConstraint("col")
         result = await c.evaluate(mock_ctx, "table")
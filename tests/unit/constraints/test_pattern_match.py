@@ -1,9 +1,10 @@
 from unittest.mock import MagicMock
 
+import pyarrow as pa
 import pytest
 from datafusion import DataFrame, SessionContext
 from qualink.constraints.assertion import Assertion
-from qualink.constraints.pattern_match import PatternMatchConstraint
+from qualink.constraints.pattern_match import PatternMatchConstraint, match_ratio_fragment, pattern_predicate
 from qualink.core.constraint import ConstraintMetadata, ConstraintStatus
 
 
@@ -74,3 +75,36 @@ class TestPatternMatchConstraint:
         assert result.metric == 0.3
         assert "Pattern match on 'col' is 0.3000" in result.message
         assert "expected > 0.5" in result.message
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("@", """strpos(CAST("col" AS VARCHAR), '@') > 0"""),
+        ("it's", """strpos(CAST("col" AS VARCHAR), 'it''s') > 0"""),
+        (r"\d+", """CAST("col" AS VARCHAR) ~ '\\d+'"""),
+        ("^abc", """starts_with(CAST("col" AS VARCHAR), 'abc')"""),
+        ("abc$", """ends_with(CAST("col" AS VARCHAR), 'abc')"""),
+        ("^it's$", """CAST("col" AS VARCHAR) = 'it''s'"""),
+        (r"^\d+$", """CAST("col" AS VARCHAR) ~ '^\\d+$'"""),
+        ("^", """CAST("col" AS VARCHAR) ~ '^'"""),
+        ("", """CAST("col" AS VARCHAR) ~ ''"""),
+    ],
+)
+def test_pattern_predicate(pattern: str, expected: str) -> None:
+    assert pattern_predicate("col", pattern) == expected
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (["a1", "b", None, "c2"], 2 / 3),
+        (["x", "y"], 0.0),
+        ([None, None], None),
+    ],
+)
+def test_match_ratio_fragment_ignores_nulls(values: list[str | None], expected: float | None) -> None:
+    ctx = SessionContext()
+    ctx.from_pydict({"col": pa.array(values, type=pa.string())}, name="t")
+    sql = f"SELECT {match_ratio_fragment('col', r'[0-9]')} AS ratio FROM t"
+    assert ctx.sql(sql).to_pylist()[0]["ratio"] == pytest.approx(expected)
@@ -11,7 +11,7 @@ class TestUniqueValueRatioConstraint:
     def test_init(self) -> None:
         assertion = Assertion.greater_than(0.5)
         c = UniqueValueRatioConstraint(["col1", "col2"], assertion, hint="check uniqueness")
-        assert c._columns == ["col1", "col2"]
+        assert c._columns == ("col1", "col2")
         assert c._assertion == assertion
         assert c._hint == "check uniqueness"
 
@@ -10,7 +10,7 @@ from qualink.core.constraint import ConstraintMetadata, ConstraintStatus
 class TestUniquenessConstraint:
     def test_init_valid(self) -> None:
         c = UniquenessConstraint(["col1", "col2"], threshold=0.9)
-        assert c._columns == ["col1", "col2"]
+        assert c._columns == ("col1", "col2")
         assert c._assertion == Assertion.greater_than_or_equal(0.9)
 
     def test_init_invalid_empty_columns(self) -> None:
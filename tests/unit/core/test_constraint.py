@@ -1,8 +1,12 @@
+import pytest
 from qualink.core.constraint import (
     Constraint,
     ConstraintMetadata,
     ConstraintResult,
     ConstraintStatus,
+    FusableConstraint,
+    query_row,
+    query_scalar,
 )
 
 
@@ -76,3 +80,35 @@ class TestConstraint:
 
         constraint = ConcreteConstraint()
         assert repr(constraint) == "ConcreteConstraint('test')"
+
+
+class TestFusableConstraint:
+    def test_requires_both_fusion_hooks(self) -> None:
+        class FragmentOnly(FusableConstraint):
+            def name(self):
+                return "test"
+
+            async def evaluate(self, ctx, table_name):
+                pass
+
+            def sql_fragment(self):
+                return "COUNT(*)"
+
+        with pytest.raises(TypeError, match="evaluate_from_row"):
+            FragmentOnly()
+
+
+class TestQueryScalar:
+    async def test_returns_first_value(self) -> None:
+        from datafusion import SessionContext
+
+        ctx = SessionContext()
+        assert await query_scalar(ctx, "SELECT 2 AS b") == 2
+
+
+class TestQueryRow:
+    async def test_returns_first_row_by_name(self) -> None:
+        from datafusion import SessionContext
+
+        ctx = SessionContext()
+        assert await query_row(ctx, "SELECT 2 AS b, 'x' AS a") == {"b": 2, "a": "x"}
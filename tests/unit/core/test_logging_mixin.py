@@ -90,3 +90,11 @@ class TestConstraintInheritsLogger:
         c = CompletenessConstraint("col", Assertion.equal_to(1.0))
         assert isinstance(c.logger, logging.Logger)
         assert "CompletenessConstraint" in c.logger.name
+
+    def test_builtin_constraints_have_no_instance_dict(self):
+        from qualink.constraints.assertion import Assertion
+        from qualink.constraints.completeness import CompletenessConstraint
+
+        c = CompletenessConstraint("col", Assertion.equal_to(1.0))
+        assert not hasattr(c, "__dict__")
+        assert c.logger is c.logger
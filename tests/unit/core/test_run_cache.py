@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+
+from datafusion import DataFrame, SessionContext
+from qualink.core.run_cache import (
+    ROW_COUNT_SQL,
+    cached_value,
+    prefetch,
+    run_cache,
+    seed_row_count,
+    store_value,
+    table_schema,
+)
+
+
+class TestRunCache:
+    def test_store_outside_scope_is_noop(self) -> None:
+        store_value("t", "MIN(x)", 1.0)
+        assert cached_value("t", "MIN(x)") is None
+
+    def test_values_live_for_the_scope(self) -> None:
+        with run_cache():
+            store_value("t", "MIN(x)", 1.0)
+            assert cached_value("t", "MIN(x)") == 1.0
+            assert cached_value("other", "MIN(x)") is None
+        assert cached_value("t", "MIN(x)") is None
+
+    def test_nested_scope_shares_cache(self) -> None:
+        with run_cache():
+            store_value("t", "MIN(x)", 1.0)
+            with run_cache():
+                assert cached_value("t", "MIN(x)") == 1.0
+                store_value("t", "MAX(x)", 2.0)
+            assert cached_value("t", "MAX(x)") == 2.0
+
+    def test_none_is_not_cached(self) -> None:
+        with run_cache():
+            store_value("t", "MIN(x)", None)
+            assert cached_value("t", "MIN(x)") is None
+
+    def test_seed_row_count(self) -> None:
+        with run_cache():
+            seed_row_count("t", 10)
+            assert cached_value("t", ROW_COUNT_SQL) == 10.0
+
+    def test_table_schema_resolved_once_per_scope(self) -> None:
+        mock_ctx = MagicMock(spec=SessionContext)
+        mock_ctx.table.return_value = MagicMock(spec=DataFrame)
+
+        with run_cache():
+            first = table_schema(mock_ctx, "t")
+            assert table_schema(mock_ctx, "t") is first
+        table_schema(mock_ctx, "t")
+
+        assert mock_ctx.table.call_count == 2
+        mock_ctx.sql.assert_not_called()
+
+    async def test_prefetch_computes_fragments_in_one_query(self) -> None:
+        ctx = SessionContext()
+        ctx.from_pydict({"x": [1, 2, 3]}, name="t")
+
+        with run_cache():
+            store_value("t", "MIN(x)", 0.0)
+            await prefetch(ctx, "t", ["MIN(x)", "MAX(x)", "MAX(x)", "COUNT(*)"])
+            assert cached_value("t", "MIN(x)") == 0.0
+            assert cached_value("t", "MAX(x)") == 3
+            assert cached_value("t", "COUNT(*)") == 3
+
+    async def test_prefetch_failure_caches_nothing(self) -> None:
+        ctx = SessionContext()
+        ctx.from_pydict({"x": [1, 2, 3]}, name="t")
+
+        with run_cache():
+            await prefetch(ctx, "t", ["MAX(x)", "MAX(missing)"])
+            assert cached_value("t", "MAX(x)") is None
+
+    async def test_prefetch_outside_scope_is_noop(self) -> None:
+        mock_ctx = MagicMock(spec=SessionContext)
+
+        await prefetch(mock_ctx, "t", ["MAX(x)"])
+
+        mock_ctx.sql.assert_not_called()
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -128,6 +129,7 @@ class TestValidationSuiteBuilder:
             .on_data(mock_ctx, "table")
             .add_check(mock_check)
             .run_parallel(True)
+            .max_parallel(2)
         )
         suite = builder.build()
         assert isinstance(suite, ValidationSuite)
@@ -137,6 +139,8 @@ class TestValidationSuiteBuilder:
         assert suite._table_name == "table"
         assert suite._checks == [mock_check]
         assert suite._run_parallel is True
+        assert suite._max_parallel == 2
+        assert suite._to_builder()._max_parallel == 2
 
     @pytest.mark.asyncio()
     async def test_built_suite_retains_configuration(self):
@@ -171,3 +175,86 @@ class TestValidationSuiteBuilder:
         assert rebound._ctx == mock_ctx
         assert rebound._table_name == "table"
         assert len(rebound._checks) == 1
+
+    @pytest.mark.asyncio
+    async def test_run_with_row_count_skips_size_query(self):
+        mock_ctx = MagicMock(spec=SessionContext)
+        check = Check.builder("size").add_constraint(SizeConstraint(Assertion.equal_to(42))).build()
+
+        result = await (
+            ValidationSuiteBuilder("test")
+            .on_data(mock_ctx, "table")
+            .add_check(check)
+            .with_row_count(42)
+            .run()
+        )
+
+        mock_ctx.sql.assert_not_called()
+        assert result.success
+        assert result.report.check_results["size"][0].metric == 42.0
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_max_parallel_rejects_non_positive(self, limit):
+        with pytest.raises(ValueError, match="max_parallel must be at least 1"):
+            ValidationSuiteBuilder("test").max_parallel(limit)
+
+    @pytest.mark.asyncio()
+    async def test_max_parallel_caps_concurrent_checks(self):
+        running = peak = 0
+
+        async def run(ctx, table_name):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return CheckResult(check=MagicMock(spec=Check), status=CheckStatus.SUCCESS)
+
+        checks = []
+        for i in range(4):
+            check = MagicMock(spec=Check)
+            check.name = f"check{i}"
+            check.run = AsyncMock(side_effect=run)
+            checks.append(check)
+
+        builder = (
+            ValidationSuiteBuilder("test")
+            .on_data(MagicMock(spec=SessionContext), "table")
+            .add_checks(checks)
+            .run_parallel(True)
+            .max_parallel(2)
+        )
+        await builder.run()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio()
+    async def test_run_counts_failures_per_level(self):
+        checks = []
+        for name, level, statuses in [
+            ("warn", Level.WARNING, [ConstraintStatus.FAILURE, ConstraintStatus.FAILURE]),
+            ("err", Level.ERROR, [ConstraintStatus.FAILURE, ConstraintStatus.SUCCESS]),
+        ]:
+            check = MagicMock(spec=Check)
+            check.name = name
+            check.level = level
+            check.run = AsyncMock(
+                return_value=CheckResult(
+                    check=check,
+                    status=CheckStatus.ERROR,
+                    constraint_results=[ConstraintResult(status=s, constraint_name="c") for s in statuses],
+                )
+            )
+            checks.append(check)
+
+        result = (
+            await ValidationSuiteBuilder("test")
+            .on_data(MagicMock(spec=SessionContext), "t")
+            .add_checks(checks)
+            .run()
+        )
+
+        metrics = result.report.metrics
+        assert (metrics.failed, metrics.warning_count, metrics.error_count) == (3, 2, 1)
+        assert result.status == CheckStatus.ERROR
+        assert len(result.report.issues) == 3
@@ -1,3 +1,4 @@
+import pytest
 from qualink.formatters.base import FormatterConfig, ResultFormatter
 
 
@@ -35,3 +36,18 @@ class TestResultFormatter:
 
         formatter = ConcreteFormatter(config)
         assert formatter._config == config
+
+    def test_iter_format_defaults_to_format(self):
+        class ConcreteFormatter(ResultFormatter):
+            def format(self, result):
+                return "report"
+
+        assert list(ConcreteFormatter().iter_format(None)) == ["report"]
+
+    def test_iter_format_formats_eagerly(self):
+        class FailingFormatter(ResultFormatter):
+            def format(self, result):
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            FailingFormatter().iter_format(None)
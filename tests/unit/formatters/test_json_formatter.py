@@ -1,4 +1,8 @@
+import io
 import json
+import types
+
+import pytest
 
 from qualink.core.constraint import ConstraintResult, ConstraintStatus
 from qualink.core.level import Level
@@ -9,6 +13,7 @@ from qualink.core.result import (
     ValidationReport,
     ValidationResult,
 )
+from qualink.formatters import json_formatter
 from qualink.formatters.base import FormatterConfig
 from qualink.formatters.json_formatter import JsonFormatter
 
@@ -137,3 +142,117 @@ class TestJsonFormatter:
                 ],
             }
         ]
+
+    def test_stream_matches_format(self):
+        issue = ValidationIssue("check1", "con1", Level.ERROR, "error msg", 0.2)
+        report = ValidationReport(
+            suite_name="Test",
+            metrics=ValidationMetrics(total_checks=1, total_constraints=1, failed=1),
+            check_results={"check1": [ConstraintResult(ConstraintStatus.FAILURE, 0.2, "error msg", "con1")]},
+            issues=[issue],
+        )
+        result = ValidationResult(success=False, status=CheckStatus.ERROR, report=report)
+
+        formatter = JsonFormatter()
+        buffer = io.StringIO()
+        formatter.stream(result, buffer)
+
+        assert buffer.getvalue() == formatter.format(result) + "\n"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_iter_format_yields_chunks_of_format(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(json_formatter, "orjson", None)
+        elif json_formatter.orjson is None:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(json_formatter, "_CHUNK_SIZE", 64)
+        issue = ValidationIssue("check1", "con1", Level.ERROR, "caf\u00e9 \u2013 error msg", 0.2)
+        report = ValidationReport(
+            suite_name="Test",
+            metrics=ValidationMetrics(total_checks=1, total_constraints=1, failed=1),
+            issues=[issue],
+        )
+        result = ValidationResult(success=False, status=CheckStatus.ERROR, report=report)
+
+        formatter = JsonFormatter()
+        chunks = list(formatter.iter_format(result))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 64 for chunk in chunks[:-1])
+        assert "".join(chunks) == formatter.format(result)
+
+    def test_iter_format_coalesces_tokens(self, monkeypatch):
+        monkeypatch.setattr(json_formatter, "orjson", None)
+        result = ValidationResult(
+            success=True,
+            status=CheckStatus.SUCCESS,
+            report=ValidationReport(suite_name="Test", metrics=ValidationMetrics(total_checks=1)),
+        )
+
+        assert len(list(JsonFormatter().iter_format(result))) == 1
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_format_with_and_without_orjson(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(json_formatter, "orjson", None)
+        elif json_formatter.orjson is None:
+            pytest.skip("orjson is not installed")
+        issue = ValidationIssue("check1", "con1", Level.ERROR, "error msg", 0.2)
+        report = ValidationReport(
+            suite_name="Test",
+            metrics=ValidationMetrics(total_checks=1, total_constraints=1, failed=1),
+            issues=[issue],
+        )
+        result = ValidationResult(success=False, status=CheckStatus.ERROR, report=report)
+
+        output = JsonFormatter().format(result)
+
+        assert output == json.dumps(json.loads(output), indent=2)
+        assert json.loads(output)["issues"][0]["metric"] == 0.2
+
+    def test_format_uses_orjson_when_available(self, monkeypatch):
+        calls = []
+
+        def fake_dumps(payload, option):
+            calls.append(option)
+            # allow_nan=False proves no non-finite float reaches the encoder.
+            return json.dumps(payload, indent=2, allow_nan=False).encode()
+
+        fake_orjson = types.SimpleNamespace(dumps=fake_dumps, OPT_INDENT_2=2)
+        monkeypatch.setattr(json_formatter, "orjson", fake_orjson)
+        result = ValidationResult(
+            success=True,
+            status=CheckStatus.SUCCESS,
+            report=ValidationReport(suite_name="Test", metrics=ValidationMetrics(total_checks=1)),
+        )
+
+        output = JsonFormatter().format(result)
+
+        assert calls == [2]
+        assert json.loads(output)["suite"] == "Test"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("metric", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_metrics_encode_as_null(self, monkeypatch, use_orjson, metric):
+        if not use_orjson:
+            monkeypatch.setattr(json_formatter, "orjson", None)
+        elif json_formatter.orjson is None:
+            pytest.skip("orjson is not installed")
+        issue = ValidationIssue("check1", "con1", Level.ERROR, "error msg", metric)
+        report = ValidationReport(
+            suite_name="Test",
+            metrics=ValidationMetrics(total_checks=1, total_constraints=1, failed=1),
+            check_results={
+                "check1": [ConstraintResult(ConstraintStatus.FAILURE, metric, "error msg", "con1")]
+            },
+            issues=[issue],
+        )
+        result = ValidationResult(success=False, status=CheckStatus.ERROR, report=report)
+
+        formatter = JsonFormatter()
+        output = formatter.format(result)
+
+        assert output == "".join(formatter.iter_format(result))
+        payload = json.loads(output)
+        assert payload["issues"][0]["metric"] is None
+        assert payload["check_results"][0]["constraints"][0]["metric"] is None
@@ -2,7 +2,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from qualink.output import ResultWriter, write_text_output
+from qualink.output import ResultWriter, write_chunks_output, write_text_output
 from qualink.output.writer import LocalFileResultSink, PyArrowFileSystemResultSink
 
 
@@ -14,6 +14,14 @@ def test_local_file_sink_writes_to_path(tmp_path: Path) -> None:
     assert target.read_text(encoding="utf-8") == '{"ok": true}'
 
 
+def test_local_file_sink_writes_chunks(tmp_path: Path) -> None:
+    target = tmp_path / "reports" / "result.json"
+
+    write_chunks_output(target, iter(['{"ok"', ": ", "true}"]))
+
+    assert target.read_text(encoding="utf-8") == '{"ok": true}'
+
+
 def test_local_file_sink_supports_plain_string_paths() -> None:
     sink = LocalFileResultSink()
 
@@ -46,6 +54,18 @@ def test_pyarrow_sink_writes_remote_uri(mock_from_uri) -> None:
     mock_stream.write.assert_called_once_with(b"hello")
 
 
+@patch("qualink.output.writer._resolve_filesystem_from_uri")
+def test_pyarrow_sink_writes_chunks_to_remote_uri(mock_from_uri) -> None:
+    mock_filesystem = MagicMock()
+    mock_stream = MagicMock()
+    mock_filesystem.open_output_stream.return_value.__enter__.return_value = mock_stream
+    mock_from_uri.return_value = (mock_filesystem, "reports/result.json")
+
+    write_chunks_output("s3://bucket/reports/result.json", iter(["hel", "lo"]))
+
+    assert [c.args[0] for c in mock_stream.write.call_args_list] == [b"hel", b"lo"]
+
+
 @patch("qualink.output.writer._resolve_filesystem_from_uri")
 def test_pyarrow_sink_logs_remote_write(
     mock_from_uri,
@@ -158,6 +158,41 @@ class TestCLIMainFunction:
         content = out_file.read_text()
         assert "test" in content
 
+    def test_main_formatter_error_keeps_existing_output(self, tmp_path):
+        yaml_file = tmp_path / "test.yaml"
+        yaml_file.write_text("suite:\n  name: test\n")
+        out_file = tmp_path / "result.md"
+        out_file.write_text("previous report")
+
+        from qualink.core.result import (
+            CheckStatus,
+            ValidationMetrics,
+            ValidationReport,
+            ValidationResult,
+        )
+
+        fake_result = ValidationResult(
+            success=True,
+            status=CheckStatus.SUCCESS,
+            report=ValidationReport(
+                suite_name="test",
+                metrics=ValidationMetrics(total_checks=1, total_constraints=1, passed=1),
+            ),
+        )
+
+        with (
+            patch("qualink.cli.run_yaml", new_callable=AsyncMock, return_value=fake_result),
+            patch(
+                "qualink.formatters.markdown_formatter.MarkdownFormatter.format",
+                autospec=True,
+                side_effect=RuntimeError("boom"),
+            ),
+        ):
+            result = runner.invoke(main, [str(yaml_file), "-f", "markdown", "-o", str(out_file)])
+
+        assert isinstance(result.exception, RuntimeError)
+        assert out_file.read_text() == "previous report"
+
     def test_main_output_to_remote_uri(self, tmp_path):
         yaml_file = tmp_path / "test.yaml"
         yaml_file.write_text("suite:\n  name: test\n")
@@ -180,7 +215,7 @@ class TestCLIMainFunction:
 
         with (
             patch("qualink.cli.run_yaml", new_callable=AsyncMock, return_value=fake_result),
-            patch("qualink.cli.write_text_output") as mock_write_output,
+            patch("qualink.cli.write_chunks_output") as mock_write_output,
         ):
             result = runner.invoke(
                 main,